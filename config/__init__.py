@@ -3,9 +3,10 @@ Configuration Package
 Centralized settings and hardware configuration
 """
 
-from config.settings import settings
+from config.settings import get_settings
 from config.hardware_config import (
     SERVO_PINS,
+    SERVO_CHANNELS,
     ULTRASONIC_PINS,
     I2C_ADDRESSES,
     CAMERA_CONFIG,
@@ -13,16 +14,39 @@ from config.hardware_config import (
     MOVEMENT_PARAMS,
     SENSOR_CONFIG,
 )
-from config.yolo_detection_config import (
-    YOLOConfig,
-    COCO_CLASSES,
-    ENHANCED_CLASS_INFO,
-    COLOR_MAP,
+
+# `config.settings` resolves to the Settings instance, not the submodule
+del settings
+
+# Loaded on first access via __getattr__
+_YOLO_EXPORTS = (
+    'YOLOConfig',
+    'COCO_CLASSES',
+    'ENHANCED_CLASS_INFO',
+    'COLOR_MAP',
+    'COLOR_ARR',
 )
 
+
+def __getattr__(name: str):
+    """Lazily build settings and load detection config on first access (PEP 562)"""
+    if name == 'settings':
+        value = get_settings()
+    elif name in _YOLO_EXPORTS:
+        from config import yolo_detection_config
+        value = getattr(yolo_detection_config, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     'settings',
+    'get_settings',
     'SERVO_PINS',
+    'SERVO_CHANNELS',
     'ULTRASONIC_PINS',
     'I2C_ADDRESSES',
     'CAMERA_CONFIG',
@@ -33,4 +57,5 @@ __all__ = [
     'COCO_CLASSES',
     'ENHANCED_CLASS_INFO',
     'COLOR_MAP',
+    'COLOR_ARR',
 ]
\ No newline at end of file
@@ -3,6 +3,8 @@ Hardware Configuration - GPIO Pin Mappings
 For Raspberry Pi with 12-servo spider robot and OV5647 camera
 """
 
+from types import MappingProxyType
+
 # ============================================
 # I2C Device Addresses
 # ============================================
@@ -43,14 +45,26 @@ SERVO_PINS = {
     'leg4_shoulder': 9,  # Channel 9
     'leg4_elbow': 10,    # Channel 10
     'leg4_foot': 11,     # Channel 11
-    
-    # Extra servos (if needed)
-    'servo12': 12,
-    'servo13': 13,
-    'servo14': 14,
-    'servo15': 15,
 }
 
+# Spare PCA9685 channels (kept out of SERVO_PINS)
+RESERVED_SERVO_CHANNELS = (12, 13, 14, 15)
+
+# ============================================
+# Servo Channel Table (leg x joint)
+# ============================================
+LEGS = ('leg1', 'leg2', 'leg3', 'leg4')
+JOINTS = ('shoulder', 'elbow', 'foot')
+
+LEG_INDEX = {leg: i for i, leg in enumerate(LEGS)}
+JOINT = {joint: i for i, joint in enumerate(JOINTS)}
+
+# SERVO_CHANNELS[leg_idx][joint_idx] -> PCA9685 channel
+SERVO_CHANNELS = tuple(
+    tuple(SERVO_PINS[f'{leg}_{joint}'] for joint in JOINTS)
+    for leg in LEGS
+)
+
 # ============================================
 # Camera Configuration (OV5647)
 # ============================================
@@ -112,26 +126,56 @@ SENSOR_CONFIG = {
     'oled': {
         'width': 128,
         'height': 64,
-        'address': 0x3C,
+        'address': I2C_ADDRESSES['oled'],
         'bus': 1,
     }
 }
 
+# ============================================
+# Read-Only Views
+# ============================================
+def _freeze(mapping: dict) -> MappingProxyType:
+    """Wrap a config dict (and any nested dicts) in read-only views"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+_SERVO_PINS_RAW = SERVO_PINS
+
+I2C_ADDRESSES = _freeze(I2C_ADDRESSES)
+ULTRASONIC_PINS = _freeze(ULTRASONIC_PINS)
+SERVO_PINS = _freeze(_SERVO_PINS_RAW)
+LEG_INDEX = _freeze(LEG_INDEX)
+JOINT = _freeze(JOINT)
+CAMERA_CONFIG = _freeze(CAMERA_CONFIG)
+I2C_CONFIG = _freeze(I2C_CONFIG)
+SERVO_LIMITS = _freeze(SERVO_LIMITS)
+MOVEMENT_PARAMS = _freeze(MOVEMENT_PARAMS)
+SENSOR_CONFIG = _freeze(SENSOR_CONFIG)
+
 # ============================================
 # Pin Verification
 # ============================================
+_SERVO_CHANNELS = tuple(_SERVO_PINS_RAW.values())
+_SERVO_CHANNEL_SET = frozenset(_SERVO_CHANNELS)
+_MAX_SERVO_CHANNEL = max(_SERVO_CHANNEL_SET)
+
+
 def verify_pins():
     """Verify all pin assignments are valid"""
-    used_servo_channels = set(SERVO_PINS.values())
-    max_channel = max(used_servo_channels)
-    
-    if max_channel > 15:
-        raise ValueError(f"Servo channel {max_channel} exceeds PCA9685 capacity (0-15)")
+    if _MAX_SERVO_CHANNEL > 15:
+        raise ValueError(f"Servo channel {_MAX_SERVO_CHANNEL} exceeds PCA9685 capacity (0-15)")
     
     # Check no duplicate channels
-    if len(used_servo_channels) != len(SERVO_PINS):
+    if len(_SERVO_CHANNEL_SET) != len(_SERVO_CHANNELS):
         raise ValueError("Duplicate servo channels detected")
     
+    # Check no active servo sits on a reserved channel
+    if not _SERVO_CHANNEL_SET.isdisjoint(RESERVED_SERVO_CHANNELS):
+        raise ValueError("Servo assigned to a reserved channel")
+    
     return True
 
 
@@ -139,4 +183,4 @@ if __name__ == "__main__":
     verify_pins()
     print("✅ Pin configuration verified")
     print(f"   Servos: {len(SERVO_PINS)} channels")
-    print(f"   Max channel: {max(SERVO_PINS.values())}")
\ No newline at end of file
+    print(f"   Max channel: {_MAX_SERVO_CHANNEL}")
\ No newline at end of file
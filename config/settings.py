@@ -3,135 +3,210 @@ Hey Spider Robot - Settings Configuration
 Complete settings management with environment variable support
 """
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
-# Load environment variables
-try:
-    from dotenv import load_dotenv
+from config.hardware_config import I2C_ADDRESSES, SERVO_LIMITS
+
+_ENV_LOADED_FLAG = '_SPIDER_ENV_LOADED'
+
+
+@functools.cache
+def _load_env_once() -> bool:
+    """
+    Load .env into the environment at most once per process tree
+    
+    Returns:
+        False if python-dotenv is needed but not installed
+    """
+    if os.environ.get(_ENV_LOADED_FLAG):
+        return True  # Already loaded by a parent process
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    
     load_dotenv()
-except ImportError:
-    print("⚠️  python-dotenv not installed, using system environment only")
+    os.environ[_ENV_LOADED_FLAG] = '1'
+    return True
+
+
+# Load environment variables
+_DOTENV_AVAILABLE = _load_env_once()
+
+# Project layout, resolved once at import
+PROJECT_ROOT = Path(__file__).parent.parent
+IMAGES_DIR = PROJECT_ROOT / 'images'
+MODELS_DIR = PROJECT_ROOT / 'models'
+LOGS_DIR = PROJECT_ROOT / 'logs'
+DATA_DIR = PROJECT_ROOT / 'data'
+
+# Snapshot the environment once so field defaults don't each hit getenv
+_ENV = dict(os.environ)
+
+
+_TRUE_LITERALS = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _as_bool(value: str) -> bool:
+    """Parse an environment flag, case-insensitively ('true'/'false', '1', 'yes', 'on')"""
+    return value.strip().lower() in _TRUE_LITERALS
+
+
+def _as_hex(value: str) -> int:
+    """Parse a hexadecimal environment value (e.g. '0x3C')"""
+    return int(value, 16)
 
 
-@dataclass
+@functools.cache
+def _ensure_dirs(*directories: Path) -> None:
+    """Create directories once per process"""
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def _get(key: str, default, cast=str):
+    """Read an environment variable from the snapshot, casting if present"""
+    value = _ENV.get(key)
+    return cast(value) if value is not None else default
+
+
+# Field defaults are cast from _ENV once, when the class body runs, so the
+# dataclass-generated __init__ only assigns precomputed values into slots
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Application settings with defaults"""
     
     # ============================================
     # API Configuration
     # ============================================
-    OPENAI_API_KEY: str = os.getenv('OPENAI_API_KEY', '')
-    AI_MODEL: str = os.getenv('AI_MODEL', 'gpt-4')
+    OPENAI_API_KEY: str = _get('OPENAI_API_KEY', '')
+    AI_MODEL: str = _get('AI_MODEL', 'gpt-4')
     
     # ============================================
     # Voice Settings
     # ============================================
-    WAKE_PHRASE: str = os.getenv('WAKE_PHRASE', 'hey spider').lower()
-    VOICE_TIMEOUT: int = int(os.getenv('VOICE_TIMEOUT', '5'))
-    VOICE_LANGUAGE: str = os.getenv('VOICE_LANGUAGE', 'en-US')
+    WAKE_PHRASE: str = _get('WAKE_PHRASE', 'hey spider', str.lower)
+    VOICE_TIMEOUT: int = _get('VOICE_TIMEOUT', 5, int)
+    VOICE_LANGUAGE: str = _get('VOICE_LANGUAGE', 'en-US')
     
     # ============================================
     # Vision Settings
     # ============================================
-    CAMERA_ENABLED: bool = os.getenv('CAMERA_ENABLED', 'true').lower() == 'true'
-    AUTO_CAPTURE_INTERVAL: int = int(os.getenv('AUTO_CAPTURE_INTERVAL', '30'))
-    CONFIDENCE_THRESHOLD: float = float(os.getenv('CONFIDENCE_THRESHOLD', '0.5'))
-    CAMERA_WIDTH: int = int(os.getenv('CAMERA_WIDTH', '640'))
-    CAMERA_HEIGHT: int = int(os.getenv('CAMERA_HEIGHT', '480'))
-    CAMERA_FPS: int = int(os.getenv('CAMERA_FPS', '30'))
+    CAMERA_ENABLED: bool = _get('CAMERA_ENABLED', True, _as_bool)
+    AUTO_CAPTURE_INTERVAL: int = _get('AUTO_CAPTURE_INTERVAL', 30, int)
+    CONFIDENCE_THRESHOLD: float = _get('CONFIDENCE_THRESHOLD', 0.5, float)
+    CAMERA_WIDTH: int = _get('CAMERA_WIDTH', 640, int)
+    CAMERA_HEIGHT: int = _get('CAMERA_HEIGHT', 480, int)
+    CAMERA_FPS: int = _get('CAMERA_FPS', 30, int)
     
     # ============================================
     # YOLO Configuration
     # ============================================
-    YOLO_MODEL: str = os.getenv('YOLO_MODEL', 'yolov8n.pt')
-    USE_YOLO_V12: bool = os.getenv('USE_YOLO_V12', 'false').lower() == 'true'
-    YOLO_DEVICE: str = os.getenv('YOLO_DEVICE', 'auto')  # auto, cpu, cuda
-    DETECTION_INTERVAL: float = float(os.getenv('DETECTION_INTERVAL', '0.1'))
-    MAX_DETECTIONS: int = int(os.getenv('MAX_DETECTIONS', '20'))
-    IOU_THRESHOLD: float = float(os.getenv('IOU_THRESHOLD', '0.4'))
+    YOLO_MODEL: str = _get('YOLO_MODEL', 'yolov8n.pt')
+    USE_YOLO_V12: bool = _get('USE_YOLO_V12', False, _as_bool)
+    YOLO_DEVICE: str = _get('YOLO_DEVICE', 'auto')  # auto, cpu, cuda
+    DETECTION_INTERVAL: float = _get('DETECTION_INTERVAL', 0.1, float)
+    MAX_DETECTIONS: int = _get('MAX_DETECTIONS', 20, int)
+    IOU_THRESHOLD: float = _get('IOU_THRESHOLD', 0.4, float)
     
     # ============================================
     # AI Thinking Settings
     # ============================================
-    AI_THINKING_INTERVAL: int = int(os.getenv('AI_THINKING_INTERVAL', '15'))
-    AI_TEMPERATURE: float = float(os.getenv('AI_TEMPERATURE', '0.8'))
-    AI_MAX_TOKENS: int = int(os.getenv('AI_MAX_TOKENS', '150'))
+    AI_THINKING_INTERVAL: int = _get('AI_THINKING_INTERVAL', 15, int)
+    AI_TEMPERATURE: float = _get('AI_TEMPERATURE', 0.8, float)
+    AI_MAX_TOKENS: int = _get('AI_MAX_TOKENS', 150, int)
+    AI_THOUGHT_CACHE_SIZE: int = _get('AI_THOUGHT_CACHE_SIZE', 256, int)  # 0 disables
+    AI_THOUGHT_CACHE_SIMILARITY: float = _get('AI_THOUGHT_CACHE_SIMILARITY', 0.92, float)
+    AI_THOUGHT_CACHE_TTL: int = _get('AI_THOUGHT_CACHE_TTL', 300, int)  # seconds
     
     # ============================================
     # Web Interface Settings
     # ============================================
-    WEB_PORT: int = int(os.getenv('WEB_PORT', '5000'))
-    WEB_HOST: str = os.getenv('WEB_HOST', '0.0.0.0')
-    WEB_DEBUG: bool = os.getenv('WEB_DEBUG', 'false').lower() == 'true'
-    SOCKETIO_PING_TIMEOUT: int = int(os.getenv('SOCKETIO_PING_TIMEOUT', '60'))
-    SOCKETIO_PING_INTERVAL: int = int(os.getenv('SOCKETIO_PING_INTERVAL', '25'))
+    WEB_PORT: int = _get('WEB_PORT', 5000, int)
+    WEB_HOST: str = _get('WEB_HOST', '0.0.0.0')
+    WEB_DEBUG: bool = _get('WEB_DEBUG', False, _as_bool)
+    SOCKETIO_PING_TIMEOUT: int = _get('SOCKETIO_PING_TIMEOUT', 60, int)
+    SOCKETIO_PING_INTERVAL: int = _get('SOCKETIO_PING_INTERVAL', 25, int)
+    SOCKETIO_ASYNC_MODE: str = _get('SOCKETIO_ASYNC_MODE', 'threading')  # threading, eventlet
     
     # ============================================
     # Hardware Settings
     # ============================================
-    SERVO_FREQUENCY: int = int(os.getenv('SERVO_FREQUENCY', '50'))
-    SERVO_MIN_PULSE: int = int(os.getenv('SERVO_MIN_PULSE', '500'))
-    SERVO_MAX_PULSE: int = int(os.getenv('SERVO_MAX_PULSE', '2500'))
-    SERVO_ACTUATION_RANGE: int = int(os.getenv('SERVO_ACTUATION_RANGE', '180'))
+    SERVO_FREQUENCY: int = _get('SERVO_FREQUENCY', SERVO_LIMITS['frequency'], int)
+    SERVO_MIN_PULSE: int = _get('SERVO_MIN_PULSE', SERVO_LIMITS['min_pulse'], int)
+    SERVO_MAX_PULSE: int = _get('SERVO_MAX_PULSE', SERVO_LIMITS['max_pulse'], int)
+    SERVO_ACTUATION_RANGE: int = _get('SERVO_ACTUATION_RANGE', SERVO_LIMITS['actuation_range'], int)
     
     # Movement parameters
-    STEP_HEIGHT: int = int(os.getenv('STEP_HEIGHT', '30'))
-    STEP_FORWARD: int = int(os.getenv('STEP_FORWARD', '20'))
-    TURN_ANGLE: int = int(os.getenv('TURN_ANGLE', '15'))
-    MOVEMENT_SPEED: float = float(os.getenv('MOVEMENT_SPEED', '0.02'))
+    STEP_HEIGHT: int = _get('STEP_HEIGHT', 30, int)
+    STEP_FORWARD: int = _get('STEP_FORWARD', 20, int)
+    TURN_ANGLE: int = _get('TURN_ANGLE', 15, int)
+    MOVEMENT_SPEED: float = _get('MOVEMENT_SPEED', 0.02, float)
     
     # Ultrasonic settings
-    ULTRASONIC_MAX_DISTANCE: int = int(os.getenv('ULTRASONIC_MAX_DISTANCE', '400'))
-    ULTRASONIC_TIMEOUT: float = float(os.getenv('ULTRASONIC_TIMEOUT', '0.1'))
+    ULTRASONIC_MAX_DISTANCE: int = _get('ULTRASONIC_MAX_DISTANCE', 400, int)
+    ULTRASONIC_TIMEOUT: float = _get('ULTRASONIC_TIMEOUT', 0.1, float)
     
     # ============================================
     # OLED Display Settings
     # ============================================
-    OLED_WIDTH: int = int(os.getenv('OLED_WIDTH', '128'))
-    OLED_HEIGHT: int = int(os.getenv('OLED_HEIGHT', '64'))
-    OLED_UPDATE_INTERVAL: float = float(os.getenv('OLED_UPDATE_INTERVAL', '0.5'))
-    OLED_I2C_ADDRESS: int = int(os.getenv('OLED_I2C_ADDRESS', '0x3C'), 16)
+    OLED_WIDTH: int = _get('OLED_WIDTH', 128, int)
+    OLED_HEIGHT: int = _get('OLED_HEIGHT', 64, int)
+    OLED_UPDATE_INTERVAL: float = _get('OLED_UPDATE_INTERVAL', 0.5, float)
+    OLED_I2C_ADDRESS: int = _get('OLED_I2C_ADDRESS', I2C_ADDRESSES['oled'], _as_hex)
     
     # ============================================
     # Logging Settings
     # ============================================
-    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
-    LOG_FILE: str = os.getenv('LOG_FILE', 'logs/spider.log')
-    LOG_MAX_SIZE: int = int(os.getenv('LOG_MAX_SIZE', '10485760'))  # 10MB
-    LOG_BACKUP_COUNT: int = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+    LOG_LEVEL: str = _get('LOG_LEVEL', 'INFO', str.upper)
+    LOG_FILE: str = _get('LOG_FILE', 'logs/spider.log')
+    LOG_MAX_SIZE: int = _get('LOG_MAX_SIZE', 10485760, int)  # 10MB
+    LOG_BACKUP_COUNT: int = _get('LOG_BACKUP_COUNT', 5, int)
     
     # ============================================
     # File Paths
     # ============================================
-    PROJECT_ROOT: Path = Path(__file__).parent.parent
-    IMAGES_DIR: Path = PROJECT_ROOT / 'images'
-    MODELS_DIR: Path = PROJECT_ROOT / 'models'
-    LOGS_DIR: Path = PROJECT_ROOT / 'logs'
-    DATA_DIR: Path = PROJECT_ROOT / 'data'
+    PROJECT_ROOT: Path = PROJECT_ROOT
+    IMAGES_DIR: Path = IMAGES_DIR
+    MODELS_DIR: Path = MODELS_DIR
+    LOGS_DIR: Path = LOGS_DIR
+    DATA_DIR: Path = DATA_DIR
     
     # ============================================
     # Performance Settings
     # ============================================
-    ENABLE_PERFORMANCE_TRACKING: bool = os.getenv('ENABLE_PERFORMANCE_TRACKING', 'true').lower() == 'true'
-    MOCK_HARDWARE: bool = os.getenv('MOCK_HARDWARE', 'false').lower() == 'true'
-    DEBUG_MODE: bool = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    ENABLE_PERFORMANCE_TRACKING: bool = _get('ENABLE_PERFORMANCE_TRACKING', True, _as_bool)
+    MOCK_HARDWARE: bool = _get('MOCK_HARDWARE', False, _as_bool)
+    DEBUG_MODE: bool = _get('DEBUG_MODE', False, _as_bool)
     
     # ============================================
     # Safety Settings
     # ============================================
-    SERVO_SAFE_MIN: int = int(os.getenv('SERVO_SAFE_MIN', '0'))
-    SERVO_SAFE_MAX: int = int(os.getenv('SERVO_SAFE_MAX', '180'))
-    OBSTACLE_STOP_DISTANCE: int = int(os.getenv('OBSTACLE_STOP_DISTANCE', '15'))  # cm
+    SERVO_SAFE_MIN: int = _get('SERVO_SAFE_MIN', 0, int)
+    SERVO_SAFE_MAX: int = _get('SERVO_SAFE_MAX', 180, int)
+    OBSTACLE_STOP_DISTANCE: int = _get('OBSTACLE_STOP_DISTANCE', 15, int)  # cm
+    
+    # ============================================
+    # Internal Caches (filled on first use)
+    # ============================================
+    _dict_cache: Optional[MappingProxyType] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _model_path_cache: Optional[Path] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _log_path_cache: Optional[Path] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate settings after initialization"""
-        # Create directories if they don't exist
-        for directory in [self.IMAGES_DIR, self.MODELS_DIR, self.LOGS_DIR, self.DATA_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
-        
         # Validate API key
         if not self.OPENAI_API_KEY and not self.MOCK_HARDWARE:
             print("⚠️  WARNING: OPENAI_API_KEY not set!")
@@ -148,8 +223,18 @@ class Settings:
         if self.WEB_PORT < 1024 or self.WEB_PORT > 65535:
             raise ValueError("WEB_PORT must be between 1024 and 65535")
     
+    def ensure_dirs(self):
+        """Create project directories if they don't exist (once per process)"""
+        _ensure_dirs(self.IMAGES_DIR, self.MODELS_DIR, self.LOGS_DIR, self.DATA_DIR)
+    
     def get_model_path(self) -> Path:
-        """Get full path to YOLO model"""
+        """Get full path to YOLO model (resolved once)"""
+        if self._model_path_cache is None:
+            object.__setattr__(self, '_model_path_cache', self._resolve_model_path())
+        return self._model_path_cache
+    
+    def _resolve_model_path(self) -> Path:
+        """Locate YOLO model on disk"""
         model_path = self.MODELS_DIR / self.YOLO_MODEL
         if not model_path.exists():
             # Try project root
@@ -163,15 +248,31 @@ class Settings:
         return bool(self.OPENAI_API_KEY and self.OPENAI_API_KEY.startswith('sk-'))
     
     def get_log_path(self) -> Path:
-        """Get full path to log file"""
-        log_path = Path(self.LOG_FILE)
-        if not log_path.is_absolute():
-            log_path = self.PROJECT_ROOT / log_path
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        return log_path
+        """Get full path to log file, creating its directory on first call"""
+        if self._log_path_cache is None:
+            log_path = Path(self.LOG_FILE)
+            if not log_path.is_absolute():
+                log_path = self.PROJECT_ROOT / log_path
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            object.__setattr__(self, '_log_path_cache', log_path)
+        return self._log_path_cache
+    
+    def as_dict(self) -> MappingProxyType:
+        """Get read-only settings snapshot (built once, settings are frozen)"""
+        if self._dict_cache is None:
+            snapshot = MappingProxyType({
+                section: MappingProxyType(values)
+                for section, values in self._build_dict().items()
+            })
+            object.__setattr__(self, '_dict_cache', snapshot)
+        return self._dict_cache
     
     def to_dict(self) -> dict:
         """Convert settings to dictionary"""
+        return {section: dict(values) for section, values in self.as_dict().items()}
+    
+    def _build_dict(self) -> dict:
+        """Build nested settings dictionary"""
         return {
             'api': {
                 'openai_configured': self.is_api_configured(),
@@ -202,15 +303,26 @@ class Settings:
         }
 
 
-# Global settings instance
-settings = Settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Build the global settings instance on first use"""
+    if not _DOTENV_AVAILABLE and not any(name in _ENV for name in Settings.__slots__):
+        print("⚠️  python-dotenv not installed, using system environment only")
+    
+    instance = Settings()
+    
+    if instance.DEBUG_MODE:
+        print("🔧 Settings loaded in DEBUG mode")
+        print(f"   Project Root: {instance.PROJECT_ROOT}")
+        print(f"   API Configured: {instance.is_api_configured()}")
+        print(f"   Camera: {'Enabled' if instance.CAMERA_ENABLED else 'Disabled'}")
+        print(f"   Web Port: {instance.WEB_PORT}")
+    
+    return instance
 
 
-# Validation on import
-if __name__ != "__main__":
-    if settings.DEBUG_MODE:
-        print("🔧 Settings loaded in DEBUG mode")
-        print(f"   Project Root: {settings.PROJECT_ROOT}")
-        print(f"   API Configured: {settings.is_api_configured()}")
-        print(f"   Camera: {'Enabled' if settings.CAMERA_ENABLED else 'Disabled'}")
-        print(f"   Web Port: {settings.WEB_PORT}")
\ No newline at end of file
+def __getattr__(name: str):
+    """Lazily expose the global `settings` instance (PEP 562)"""
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
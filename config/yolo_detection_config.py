@@ -3,9 +3,14 @@ YOLO Detection Configuration
 Object detection parameters and class information
 """
 
+import hashlib
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Tuple
 
+import numpy as np
+
 # ============================================
 # YOLO Model Configuration
 # ============================================
@@ -42,25 +47,21 @@ class YOLOConfig:
 # ============================================
 # COCO Classes (YOLOv8 Standard)
 # ============================================
-COCO_CLASSES = {
-    0: 'person', 1: 'bicycle', 2: 'car', 3: 'motorcycle', 4: 'airplane',
-    5: 'bus', 6: 'train', 7: 'truck', 8: 'boat', 9: 'traffic light',
-    10: 'fire hydrant', 11: 'stop sign', 12: 'parking meter', 13: 'bench',
-    14: 'cat', 15: 'dog', 16: 'horse', 17: 'sheep', 18: 'cow', 19: 'elephant',
-    20: 'bear', 21: 'zebra', 22: 'giraffe', 23: 'backpack', 24: 'umbrella',
-    25: 'handbag', 26: 'tie', 27: 'suitcase', 28: 'frisbee', 29: 'skis',
-    30: 'snowboard', 31: 'sports ball', 32: 'kite', 33: 'baseball bat',
-    34: 'baseball glove', 35: 'skateboard', 36: 'surfboard', 37: 'tennis racket',
-    38: 'bottle', 39: 'wine glass', 40: 'cup', 41: 'fork', 42: 'knife',
-    43: 'spoon', 44: 'bowl', 45: 'banana', 46: 'apple', 47: 'sandwich',
-    48: 'orange', 49: 'broccoli', 50: 'carrot', 51: 'hot dog', 52: 'pizza',
-    53: 'donut', 54: 'cake', 55: 'chair', 56: 'couch', 57: 'potted plant',
-    58: 'bed', 59: 'dining table', 60: 'toilet', 61: 'tv', 62: 'laptop',
-    63: 'mouse', 64: 'remote', 65: 'keyboard', 66: 'microwave', 67: 'oven',
-    68: 'toaster', 69: 'sink', 70: 'refrigerator', 71: 'book', 72: 'clock',
-    73: 'vase', 74: 'scissors', 75: 'teddy bear', 76: 'hair drier',
-    77: 'toothbrush'
-}
+# Indexed by class ID; names are interned so lookups share one object each
+COCO_CLASSES = tuple(map(sys.intern, (
+    'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus', 'train',
+    'truck', 'boat', 'traffic light', 'fire hydrant', 'stop sign',
+    'parking meter', 'bench', 'cat', 'dog', 'horse', 'sheep', 'cow', 'elephant',
+    'bear', 'zebra', 'giraffe', 'backpack', 'umbrella', 'handbag', 'tie',
+    'suitcase', 'frisbee', 'skis', 'snowboard', 'sports ball', 'kite',
+    'baseball bat', 'baseball glove', 'skateboard', 'surfboard',
+    'tennis racket', 'bottle', 'wine glass', 'cup', 'fork', 'knife', 'spoon',
+    'bowl', 'banana', 'apple', 'sandwich', 'orange', 'broccoli', 'carrot',
+    'hot dog', 'pizza', 'donut', 'cake', 'chair', 'couch', 'potted plant',
+    'bed', 'dining table', 'toilet', 'tv', 'laptop', 'mouse', 'remote',
+    'keyboard', 'microwave', 'oven', 'toaster', 'sink', 'refrigerator', 'book',
+    'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 'toothbrush',
+)))
 
 # ============================================
 # Enhanced Class Information
@@ -120,89 +121,170 @@ COLOR_MAP = {
 # ============================================
 # Detection Filtering
 # ============================================
-class DetectionFilter:
-    """Filter detections based on criteria"""
-    
-    # Classes to ignore
-    IGNORE_CLASSES = {
-        11: 'stop sign',  # Too common
-        12: 'parking meter',  # Not relevant
-    }
-    
-    # Minimum confidence by class
-    MIN_CONFIDENCE_BY_CLASS = {
-        0: 0.6,   # person (higher threshold)
-        14: 0.5,  # cat
-        15: 0.5,  # dog
-    }
-    
-    @staticmethod
-    def should_include(class_id: int, confidence: float) -> bool:
-        """Check if detection should be included"""
-        if class_id in DetectionFilter.IGNORE_CLASSES:
-            return False
-        
-        min_conf = DetectionFilter.MIN_CONFIDENCE_BY_CLASS.get(
-            class_id, YOLOConfig.CONFIDENCE_THRESHOLD
-        )
-        
-        return confidence >= min_conf
+# Classes to ignore
+IGNORE_CLASSES = {
+    11: 'stop sign',  # Too common
+    12: 'parking meter',  # Not relevant
+}
+
+# Minimum confidence by class
+MIN_CONFIDENCE_BY_CLASS = {
+    0: 0.6,   # person (higher threshold)
+    14: 0.5,  # cat
+    15: 0.5,  # dog
+}
 
 
 # ============================================
 # Performance Optimization
 # ============================================
-class PerformanceConfig:
-    """Performance tuning options"""
-    
-    # Frame skipping for faster processing
-    SKIP_FRAMES = 2  # Process every Nth frame
-    
-    # Resize frames for faster detection
-    RESIZE_FACTOR = 1.0  # 1.0 = full size, 0.5 = half size
-    
-    # Use lower resolution model
-    USE_NANO_MODEL = True  # Use yolov8n instead of yolov8m
+# Frame skipping for faster processing
+SKIP_FRAMES = 2  # Process every Nth frame
+
+# Resize frames for faster detection
+RESIZE_FACTOR = 1.0  # 1.0 = full size, 0.5 = half size
+
+# Use lower resolution model
+USE_NANO_MODEL = True  # Use yolov8n instead of yolov8m
+
+# Threading
+USE_THREADING = True
+NUM_THREADS = 4
+
+# Cache detections
+CACHE_DETECTIONS = True
+CACHE_TTL = 0.1  # seconds
+
+
+# ============================================
+# Utilities
+# ============================================
+def _color_from_md5(class_id: int) -> Tuple[int, int, int]:
+    """Generate consistent color from class ID"""
+    hash_int = int(hashlib.md5(str(class_id).encode()).hexdigest(), 16)
     
-    # Threading
-    USE_THREADING = True
-    NUM_THREADS = 4
+    b = (hash_int >> 0) & 0xFF
+    g = (hash_int >> 8) & 0xFF
+    r = (hash_int >> 16) & 0xFF
     
-    # Cache detections
-    CACHE_DETECTIONS = True
-    CACHE_TTL = 0.1  # seconds
+    return (b, g, r)
 
 
 # ============================================
-# Utilities
+# Per-Class Metadata Table
 # ============================================
+# One row per class ID: (name, color, category, min_confidence, ignored)
+META_NAME, META_COLOR, META_CATEGORY, META_MIN_CONF, META_IGNORED = range(5)
+
+_LUT_SIZE = 256  # Covers COCO and custom models with up to 256 classes
+
+
+def _build_meta(class_id: int) -> tuple:
+    """Merge all per-class lookups into a single metadata row"""
+    info = ENHANCED_CLASS_INFO.get(class_id)
+    known = 0 <= class_id < len(COCO_CLASSES)
+    return (
+        COCO_CLASSES[class_id] if known else sys.intern(f'class_{class_id}'),
+        info['color'] if info else _color_from_md5(class_id),
+        sys.intern(info['category'] if info else 'other'),
+        MIN_CONFIDENCE_BY_CLASS.get(class_id, YOLOConfig.CONFIDENCE_THRESHOLD),
+        class_id in IGNORE_CLASSES,
+    )
+
+
+CLASS_META = [_build_meta(class_id) for class_id in range(_LUT_SIZE)]
+
+# BGR colors as a (256, 3) array so a batch of class IDs maps in one gather
+COLOR_ARR = np.array([meta[META_COLOR] for meta in CLASS_META], dtype=np.uint8)
+
+# Filtering thresholds as arrays for whole-frame masking
+_MIN_CONF_LUT = np.array([meta[META_MIN_CONF] for meta in CLASS_META], dtype=np.float32)
+_IGNORE_LUT = np.array([meta[META_IGNORED] for meta in CLASS_META], dtype=bool)
+
+
+def _meta(class_id: int) -> tuple:
+    """Get metadata row for class ID"""
+    if 0 <= class_id < _LUT_SIZE:
+        return CLASS_META[class_id]
+    return _build_meta(class_id)
+
+
 def get_class_name(class_id: int) -> str:
     """Get class name by ID"""
-    return COCO_CLASSES.get(class_id, f'class_{class_id}')
+    return _meta(class_id)[META_NAME]
 
 
 def get_class_color(class_id: int) -> Tuple[int, int, int]:
     """Get color for class ID"""
-    if class_id in ENHANCED_CLASS_INFO:
-        return ENHANCED_CLASS_INFO[class_id]['color']
-    
-    # Generate consistent color from class ID
-    import hashlib
-    hash_obj = hashlib.md5(str(class_id).encode())
-    hash_int = int(hash_obj.hexdigest(), 16)
-    
-    b = (hash_int >> 0) & 0xFF
-    g = (hash_int >> 8) & 0xFF
-    r = (hash_int >> 16) & 0xFF
-    
-    return (b, g, r)
+    return _meta(class_id)[META_COLOR]
 
 
 def get_category(class_id: int) -> str:
     """Get category for class ID"""
-    if class_id in ENHANCED_CLASS_INFO:
-        return ENHANCED_CLASS_INFO[class_id]['category']
-    return 'other'
+    return _meta(class_id)[META_CATEGORY]
+
+
+def get_class_colors(class_ids: np.ndarray) -> np.ndarray:
+    """Vectorized get_class_color: (N, 3) uint8 BGR colors for a batch of class IDs"""
+    outside = (class_ids < 0) | (class_ids >= _LUT_SIZE)
+    colors = COLOR_ARR.take(class_ids, axis=0, mode='clip')
+    
+    # IDs outside the table are rare; give them the same color get_class_color does
+    for i in np.flatnonzero(outside):
+        colors[i] = _meta(int(class_ids[i]))[META_COLOR]
+    return colors
+
+
+# (ignored, min_confidence) table is bound as a default argument so each call
+# is a single tuple index with no global or attribute lookups
+def should_include(class_id: int, confidence: float,
+                   _table=tuple((meta[META_IGNORED], meta[META_MIN_CONF])
+                                for meta in CLASS_META),
+                   _size=_LUT_SIZE,
+                   _fallback=_meta) -> bool:
+    """Check if detection should be included"""
+    if 0 <= class_id < _size:
+        ignored, min_conf = _table[class_id]
+    else:
+        meta = _fallback(class_id)
+        ignored, min_conf = meta[META_IGNORED], meta[META_MIN_CONF]
+    return not ignored and confidence >= min_conf
+
+
+
+def filter_detections(class_ids: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+    """
+    Vectorized should_include over a whole frame's detections
+    
+    Args:
+        class_ids: Integer class IDs, one per box
+        confidences: Confidence scores, one per box
+        
+    Returns:
+        Boolean mask of detections to keep
+    """
+    # IDs outside the table (negative or past the end) share the last row,
+    # which holds the defaults, rather than borrowing a real class's thresholds
+    class_ids = np.where((class_ids < 0) | (class_ids >= _LUT_SIZE), _LUT_SIZE - 1, class_ids)
+    return ~_IGNORE_LUT[class_ids] & (confidences >= _MIN_CONF_LUT[class_ids])
+
+
+# Backward-compatible namespaces for the former config classes
+DetectionFilter = SimpleNamespace(
+    IGNORE_CLASSES=IGNORE_CLASSES,
+    MIN_CONFIDENCE_BY_CLASS=MIN_CONFIDENCE_BY_CLASS,
+    should_include=should_include,
+)
+
+PerformanceConfig = SimpleNamespace(
+    SKIP_FRAMES=SKIP_FRAMES,
+    RESIZE_FACTOR=RESIZE_FACTOR,
+    USE_NANO_MODEL=USE_NANO_MODEL,
+    USE_THREADING=USE_THREADING,
+    NUM_THREADS=NUM_THREADS,
+    CACHE_DETECTIONS=CACHE_DETECTIONS,
+    CACHE_TTL=CACHE_TTL,
+)
 
 
 if __name__ == "__main__":
@@ -52,7 +52,12 @@ echo "⚙️  Installing hardware dependencies..."
 sudo apt-get install -y \
     i2c-tools \
     python3-smbus \
-    python3-rpi.gpio
+    python3-rpi.gpio \
+    pigpio \
+    python3-pigpio
+
+# pigpio daemon timestamps GPIO edges for the ultrasonic sensor
+sudo systemctl enable --now pigpiod
 
 # Camera support (choose based on OS version)
 echo "   Installing camera support..."
@@ -74,6 +79,13 @@ if ! grep -q "i2c_arm=on" /boot/config.txt 2>/dev/null; then
     echo "   ⚠️  I2C enabled - reboot required"
 fi
 
+# Run I2C at fast-mode speed (matches I2C_CONFIG['speed'])
+if ! grep -q "i2c_arm_baudrate" /boot/config.txt 2>/dev/null; then
+    echo "   Setting I2C clock to 400kHz..."
+    echo "dtparam=i2c_arm_baudrate=400000" | sudo tee -a /boot/config.txt > /dev/null
+    echo "   ⚠️  I2C clock changed - reboot required"
+fi
+
 # Enable Camera
 if ! grep -q "start_x=1" /boot/config.txt 2>/dev/null; then
     echo "   Enabling Camera..."
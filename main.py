@@ -14,17 +14,40 @@ Features:
 - Graceful shutdown management
 """
 
+import os
+
+# Green threads for Socket.IO have to be patched in before anything imports
+# threading, queue or logging, so this reads the process environment directly
+# (a value that only lives in .env is loaded too late to take effect here)
+if os.environ.get('SOCKETIO_ASYNC_MODE') == 'eventlet':
+    try:
+        import eventlet
+        eventlet.monkey_patch()
+    except ImportError:
+        pass  # WebInterface falls back to threading mode
+
 import sys
 import time
 import signal
-import json
+import re
 import traceback
-import os
+import logging
+import queue
 import threading
+import itertools
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# Prefer orjson for parsing AI responses when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -42,15 +65,173 @@ BANNER = """
 ╚═══════════════════════════════════════════════════════════╝
 """
 
+# Console blocks, each written with a single stdout call
+RULE = "=" * 63
+SHUTDOWN_RULE = "=" * 60
+
+INIT_COMPLETE = f"{RULE}\n✅ INITIALIZATION COMPLETE\n{RULE}\n"
+
+STARTING_HEADER = f"\n{RULE}\n🚀 STARTING HEY SPIDER ROBOT SYSTEMS\n{RULE}\n"
+
+ACTIVE_HEADER = f"\n{RULE}\n🎉 HEY SPIDER ROBOT IS NOW ACTIVE!\n{RULE}\n"
+
+CONTROLS_HELP = (
+    "\n📢 Voice Commands: Say 'Hey Spider' + command\n"
+    "⌨️  Keyboard: W/↑=forward, A/←=left, D/→=right, Space=dance, P=photo\n"
+)
+
+STOP_HINT = f"\n{RULE}\nPress Ctrl+C to stop\n{RULE}\n\n"
+
+STATS_TEMPLATE = """
+{rule}
+📊 SESSION STATISTICS
+{rule}
+⏱️  Runtime: {runtime:.1f} seconds ({minutes:.1f} minutes)
+📝 Commands Processed: {commands}
+📸 Photos Captured: {photos}
+👁️  Detections Made: {detections}
+❌ Errors: {errors}
+"""
+
+
+# Fallback dashboard page (Jinja template, rendered once per status combination)
+MINIMAL_PAGE_TEMPLATE = """
+<html>
+<head><title>Hey Spider Robot - Minimal Mode</title></head>
+<body style="font-family: Arial; padding: 20px; background: #0a0e27; color: white;">
+    <h1>🕷️ Hey Spider Robot</h1>
+    <p>Running in minimal mode due to initialization errors.</p>
+    <h2>Status:</h2>
+    <ul>
+        <li>Spider Controller: {{ 'OK' if spider else 'Error' }}</li>
+        <li>Vision System: {{ 'OK' if vision else 'Error' }}</li>
+        <li>AI System: {{ 'OK' if ai else 'Error' }}</li>
+    </ul>
+</body>
+</html>
+"""
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records unformatted so tracebacks are rendered on the listener thread"""
+    
+    def prepare(self, record):
+        return record
+
+
+# Component and command failures are logged here; the listener thread does
+# the traceback formatting (source-line reads) off the init/command path
+log = logging.getLogger('HeySpiderRobot.main')
+log.propagate = False
+_error_queue = queue.SimpleQueue()
+log.addHandler(_DeferredQueueHandler(_error_queue))
+
+# getLevelName() maps a known name to its number, so anything else is a typo
+# in LOG_LEVEL; fall back to INFO rather than failing the import
+if isinstance(logging.getLevelName(settings.LOG_LEVEL), int):
+    LOG_LEVEL = settings.LOG_LEVEL
+else:
+    LOG_LEVEL = 'INFO'
+    log.warning("Unknown LOG_LEVEL %r - using INFO", settings.LOG_LEVEL)
+log.setLevel(LOG_LEVEL)
+_error_listener = QueueListener(_error_queue, logging.StreamHandler(sys.stderr))
+
+
+# Runtime directories (leaves only, parents come with them); the marker
+# records that they were created so warm starts skip the syscalls
+RUNTIME_DIRS = ('images/raw', 'images/detections', 'images/night_vision',
+                'logs', 'data', 'models')
+DIRS_MARKER = Path('data/.dirs_ready')
+
+# Subsystem modules, pre-imported in the background while the banner prints
+_SUBSYSTEM_MODULES = (
+    'src.oled_display',
+    'src.spider_controller',
+    'src.ai_thinking',
+    'src.voice_activation',
+    'src.web_interface',
+)
+_VISION_MODULES = ('src.enhanced_visual_monitor', 'src.visual_monitor')
+
+
+def _warm_imports():
+    """Load subsystem modules into sys.modules ahead of component init"""
+    modules = _SUBSYSTEM_MODULES
+    if settings.CAMERA_ENABLED:
+        modules += _VISION_MODULES
+    
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # Reported when the component itself initializes
+
+
+def _write(block: str):
+    """Write a pre-joined block of console output at once"""
+    sys.stdout.write(block)
+    sys.stdout.flush()
+
+
+# ============================================
+# Voice Command Matching
+# ============================================
+# Intent -> trigger substrings, listed in dispatch priority order
+COMMAND_KEYWORDS = (
+    ('forward', ('forward', 'walk', 'move', 'ahead')),
+    ('backward', ('backward', 'back')),
+    ('left', ('left',)),
+    ('right', ('right',)),
+    ('dance', ('dance',)),
+    ('wave', ('wave', 'hello')),
+    ('sit', ('sit',)),
+    ('stand', ('stand',)),
+    ('photo', ('photo', 'picture', 'capture', 'snapshot')),
+    ('what', ('what',)),  # Only counts together with 'see'
+    ('stop', ('stop',)),
+    ('see', ('see',)),
+)
+
+# One alternation scans the command once in the C regex engine, so dispatch
+# stays a single linear pass even for long transcripts; lastgroup names the intent
+_COMMAND_RE = re.compile('|'.join(
+    f"(?P<{intent}>{'|'.join(words)})" for intent, words in COMMAND_KEYWORDS
+))
+_COMMAND_PRIORITY = tuple(intent for intent, _ in COMMAND_KEYWORDS)
+
+# Session statistic slots
+COMMANDS, PHOTOS, DETECTIONS, ERRORS = range(4)
+STAT_NAMES = ('commands_processed', 'photos_captured', 'detections_made', 'errors')
+
+# AI action -> (component attribute, method name)
+AI_ACTIONS = {
+    'walk_forward': ('spider', 'walk_forward'),
+    'turn_left': ('spider', 'turn_left'),
+    'turn_right': ('spider', 'turn_right'),
+    'dance': ('spider', 'dance'),
+    'wave': ('spider', 'wave'),
+    'take_photo': ('vision', 'capture_photo'),
+}
+
+
 class HeySpiderRobot:
     """Main robot controller with comprehensive initialization"""
     
     def __init__(self):
-        print(BANNER)
-        print(f"🐍 Python {sys.version}")
-        print(f"📁 Working Directory: {os.getcwd()}")
-        print(f"🔑 OpenAI API Key: {'✓ Configured' if settings.OPENAI_API_KEY else '✗ Missing'}")
-        print("=" * 63)
+        _error_listener.start()
+        threading.Thread(target=_warm_imports, daemon=True, name="ImportWarmer").start()
+        
+        # Settings used by startup/status output
+        self._web_port = settings.WEB_PORT
+        self._has_api_key = bool(settings.OPENAI_API_KEY)
+        
+        _write(
+            f"{BANNER}\n"
+            f"🐍 Python {sys.version}\n"
+            f"📁 Working Directory: {os.getcwd()}\n"
+            f"🔑 OpenAI API Key: {'✓ Configured' if self._has_api_key else '✗ Missing'}\n"
+            f"{RULE}\n"
+        )
         
         # Component references
         self.oled = None
@@ -59,130 +240,219 @@ class HeySpiderRobot:
         self.ai = None
         self.voice = None
         self.web = None
+        self._http = None
         self.running = False
         
         # Shutdown management
         self.shutdown_requested = False
         self.shutdown_in_progress = False
-        self.start_time = time.time()
-        
-        # Statistics
-        self.stats = {
-            'commands_processed': 0,
-            'photos_captured': 0,
-            'detections_made': 0,
-            'errors': 0
+        self._stop_event = threading.Event()
+        self._start_ns = time.monotonic_ns()
+        
+        # Statistics, bumped from command, vision and web threads
+        self._stats_lock = threading.Lock()
+        self._stats_values = [0] * len(STAT_NAMES)
+        
+        # Voice command intent -> handler
+        self._command_handlers = {
+            'forward': self._cmd_forward,
+            'backward': self._cmd_backward,
+            'left': self._cmd_left,
+            'right': self._cmd_right,
+            'dance': self._cmd_dance,
+            'wave': self._cmd_wave,
+            'sit': self._cmd_sit,
+            'stand': self._cmd_stand,
+            'photo': self._cmd_photo,
+            'what': self._cmd_describe,
+            'stop': self._cmd_stop,
         }
         
+        # AI action -> bound component method, filled by _get_ai_action
+        self._ai_action_map = {}
+        
         # Initialize all components
         self._initialize_components()
         
-        print("=" * 63)
-        print("✅ INITIALIZATION COMPLETE")
-        print("=" * 63)
+        _write(INIT_COMPLETE)
+        
+    def _count(self, stat: int):
+        """Increment a session statistic"""
+        with self._stats_lock:
+            self._stats_values[stat] += 1
+    
+    @property
+    def stats(self) -> dict:
+        """Session statistics by name"""
+        with self._stats_lock:
+            return dict(zip(STAT_NAMES, self._stats_values))
         
     def _initialize_components(self):
         """Initialize all robot components with error handling"""
+        # 1. OLED first, for visual feedback during the rest of startup
+        self._print_status(self._init_oled())
         
-        # 1. OLED Display (first for visual feedback)
-        print("\n[1/6] 📺 Initializing OLED Display...")
+        # 2-3, 5. Spider, camera and voice only depend on the OLED and spend
+        # their init time in hardware probes, so bring them up concurrently.
+        # Each task assigns a single distinct attribute, so no lock is needed.
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="Init") as pool:
+            spider = pool.submit(self._init_spider)
+            vision = pool.submit(self._init_vision)
+            voice = pool.submit(self._init_voice)
+            
+            # Report in the usual order once each finishes
+            self._print_status(spider.result())
+            self._print_status(vision.result())
+            
+            # 4. AI needs spider and vision, but can overlap a slow voice probe
+            ai = pool.submit(self._init_ai)
+            self._print_status(ai.result())
+            self._print_status(voice.result())
+        
+        # 6. Web needs every other component
+        self._print_status(self._init_web())
+        
+        if self.web is None:
+            self._create_fallback_web()
+    
+    @staticmethod
+    def _print_status(lines: list):
+        """Print one component's initialization report"""
+        _write("\n".join(lines) + "\n")
+    
+    def _init_oled(self) -> list:
+        """Initialize OLED display"""
+        status = ["\n[1/6] 📺 Initializing OLED Display..."]
         try:
             from src.oled_display import OLEDDisplay
             self.oled = OLEDDisplay()
             if self.oled.display:
                 self.oled.show_startup_message()
                 self.oled.start()
-                print("     ✅ OLED display active")
+                status.append("     ✅ OLED display active")
             else:
-                print("     ⚠️  OLED display in mock mode")
+                status.append("     ⚠️  OLED display in mock mode")
         except Exception as e:
-            print(f"     ❌ OLED initialization failed: {e}")
+            status.append(f"     ❌ OLED initialization failed: {e}")
             self.oled = None
-            
-        # 2. Spider Controller (hardware interface)
-        print("\n[2/6] 🤖 Initializing Spider Controller...")
+        return status
+    
+    def _init_spider(self) -> list:
+        """Initialize spider controller (hardware interface)"""
+        status = ["\n[2/6] 🤖 Initializing Spider Controller..."]
         try:
             from src.spider_controller import SpiderController
             self.spider = SpiderController(self.oled)
-            print("     ✅ Spider controller ready")
+            status.append("     ✅ Spider controller ready")
         except Exception as e:
-            print(f"     ❌ Spider controller failed: {e}")
-            traceback.print_exc()
+            status.append(f"     ❌ Spider controller failed: {e}")
+            log.exception("Spider controller failed")
             self.spider = None
-            
-        # 3. Visual Monitor (camera + YOLO)
-        print("\n[3/6] 📹 Initializing Visual Monitoring System...")
+        return status
+    
+    def _init_vision(self) -> list:
+        """Initialize visual monitor (camera + YOLO)"""
+        status = ["\n[3/6] 📹 Initializing Visual Monitoring System..."]
+        if not settings.CAMERA_ENABLED:
+            # Skip the OpenCV/YOLO imports entirely
+            status.append("     ⏸️  Camera disabled in settings (CAMERA_ENABLED=false)")
+            return status
+        
         try:
             # Try enhanced monitor first (YOLOv12)
             try:
                 from src.enhanced_visual_monitor import VisualMonitor
-                print("     Using Enhanced Visual Monitor (YOLOv12)")
+                status.append("     Using Enhanced Visual Monitor (YOLOv12)")
             except ImportError:
                 from src.visual_monitor import VisualMonitor
-                print("     Using Standard Visual Monitor (YOLOv8)")
+                status.append("     Using Standard Visual Monitor (YOLOv8)")
                 
             self.vision = VisualMonitor(self.oled)
             
             # Auto-start camera
-            print("     🎥 Auto-starting camera...")
+            status.append("     🎥 Auto-starting camera...")
             if self.vision.camera_active:
-                print("     ✅ Camera system active")
+                status.append("     ✅ Camera system active")
             else:
-                print("     ⚠️  Camera in mock mode")
+                status.append("     ⚠️  Camera in mock mode")
                 
         except Exception as e:
-            print(f"     ❌ Visual monitoring failed: {e}")
-            traceback.print_exc()
+            status.append(f"     ❌ Visual monitoring failed: {e}")
+            log.exception("Visual monitoring failed")
             self.vision = None
-            
-        # 4. AI Thinking (OpenAI integration)
-        print("\n[4/6] 🧠 Initializing AI Thinking Engine...")
+        return status
+    
+    def _init_ai(self) -> list:
+        """Initialize AI thinking engine (OpenAI integration)"""
+        status = ["\n[4/6] 🧠 Initializing AI Thinking Engine..."]
         try:
             from src.ai_thinking import AIThinking
-            self.ai = AIThinking(self.spider, self.vision, self.oled)
+            self._http = self._create_http_client()
+            self.ai = AIThinking(self.spider, self.vision, self.oled,
+                                 http_client=self._http)
             
             if self.ai.client:
-                print("     ✅ AI engine connected to OpenAI")
+                status.append("     ✅ AI engine connected to OpenAI")
             else:
-                print("     ⚠️  AI engine in offline mode")
+                status.append("     ⚠️  AI engine in offline mode")
                 
         except Exception as e:
-            print(f"     ❌ AI initialization failed: {e}")
-            traceback.print_exc()
+            status.append(f"     ❌ AI initialization failed: {e}")
+            log.exception("AI initialization failed")
             self.ai = None
-            
-        # 5. Voice Activation (speech recognition)
-        print("\n[5/6] 🎙️  Initializing Voice Activation...")
+        return status
+    
+    def _create_http_client(self):
+        """Build one pooled HTTPS client (and SSL context) for API traffic"""
+        if not self._has_api_key:
+            return None
+        try:
+            import ssl
+            import httpx
+        except ImportError:
+            return None
+        
+        return httpx.Client(
+            verify=ssl.create_default_context(),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    
+    def _init_voice(self) -> list:
+        """Initialize voice activation (speech recognition)"""
+        status = ["\n[5/6] 🎙️  Initializing Voice Activation..."]
         try:
             from src.voice_activation import VoiceActivation
             self.voice = VoiceActivation(self.handle_voice_command, self.oled)
             
             if self.voice.recognizer:
-                print("     ✅ Voice recognition active")
+                status.append("     ✅ Voice recognition active")
             else:
-                print("     ⚠️  Voice system in mock mode")
+                status.append("     ⚠️  Voice system in mock mode")
                 
         except Exception as e:
-            print(f"     ❌ Voice activation failed: {e}")
-            traceback.print_exc()
+            status.append(f"     ❌ Voice activation failed: {e}")
+            log.exception("Voice activation failed")
             self.voice = None
-            
-        # 6. Web Interface (Flask + SocketIO)
-        print("\n[6/6] 🌐 Initializing Web Interface...")
+        return status
+    
+    def _init_web(self) -> list:
+        """Initialize web interface (Flask + SocketIO)"""
+        status = ["\n[6/6] 🌐 Initializing Web Interface..."]
         try:
             from src.web_interface import WebInterface
             self.web = WebInterface(self.spider, self.vision, self.ai, self.oled)
-            print(f"     ✅ Web interface ready on port {settings.WEB_PORT}")
+            status.append(f"     ✅ Web interface ready on port {self._web_port}")
         except Exception as e:
-            print(f"     ❌ Web interface failed: {e}")
-            traceback.print_exc()
-            self._create_fallback_web()
+            status.append(f"     ❌ Web interface failed: {e}")
+            log.exception("Web interface failed")
+            self.web = None
+        return status
             
     def _create_fallback_web(self):
         """Create minimal fallback web interface"""
         try:
             print("     🔄 Creating fallback web interface...")
-            from flask import Flask, jsonify, render_template_string
+            from flask import Flask, Response, jsonify, render_template_string
             
             class MinimalWeb:
                 def __init__(self, spider, vision, ai):
@@ -190,26 +460,24 @@ class HeySpiderRobot:
                     self.spider = spider
                     self.vision = vision
                     self.ai = ai
+                    self._server = None
                     self.setup_routes()
                     
                 def setup_routes(self):
+                    # Only three booleans vary, so render all eight pages up front
+                    with self.app.app_context():
+                        pages = {
+                            flags: render_template_string(
+                                MINIMAL_PAGE_TEMPLATE,
+                                spider=flags[0], vision=flags[1], ai=flags[2]
+                            ).encode('utf-8')
+                            for flags in itertools.product((True, False), repeat=3)
+                        }
+                    
                     @self.app.route('/')
                     def index():
-                        return render_template_string("""
-                        <html>
-                        <head><title>Hey Spider Robot - Minimal Mode</title></head>
-                        <body style="font-family: Arial; padding: 20px; background: #0a0e27; color: white;">
-                            <h1>🕷️ Hey Spider Robot</h1>
-                            <p>Running in minimal mode due to initialization errors.</p>
-                            <h2>Status:</h2>
-                            <ul>
-                                <li>Spider Controller: {{ 'OK' if spider else 'Error' }}</li>
-                                <li>Vision System: {{ 'OK' if vision else 'Error' }}</li>
-                                <li>AI System: {{ 'OK' if ai else 'Error' }}</li>
-                            </ul>
-                        </body>
-                        </html>
-                        """, spider=self.spider, vision=self.vision, ai=self.ai)
+                        flags = (bool(self.spider), bool(self.vision), bool(self.ai))
+                        return Response(pages[flags], mimetype='text/html')
                         
                     @self.app.route('/health')
                     def health():
@@ -221,7 +489,19 @@ class HeySpiderRobot:
                         })
                         
                 def run(self, host='0.0.0.0', port=5000, debug=False):
-                    self.app.run(host=host, port=port, debug=debug)
+                    # Threaded server so /health polls don't queue behind each other
+                    from werkzeug.serving import make_server
+                    self.app.debug = debug
+                    self._server = make_server(host, port, self.app, threaded=True)
+                    try:
+                        self._server.serve_forever()
+                    finally:
+                        self._server.server_close()
+                        
+                def shutdown(self):
+                    """Stop serve_forever() when run() is on another thread"""
+                    if self._server:
+                        self._server.shutdown()
                     
             self.web = MinimalWeb(self.spider, self.vision, self.ai)
             print("     ✅ Fallback web interface created")
@@ -233,7 +513,7 @@ class HeySpiderRobot:
     def handle_voice_command(self, command: str):
         """Process voice commands with comprehensive handling"""
         print(f"\n🎤 Voice Command: '{command}'")
-        self.stats['commands_processed'] += 1
+        self._count(COMMANDS)
         
         try:
             if self.oled:
@@ -242,116 +522,137 @@ class HeySpiderRobot:
                 
             command = command.lower().strip()
             
-            # Movement commands
-            if any(word in command for word in ['forward', 'walk', 'move', 'ahead']):
-                if self.spider:
-                    self.spider.walk_forward()
-                    self._speak_response("Moving forward")
-                    
-            elif 'back' in command or 'backward' in command:
-                if self.spider:
-                    self.spider.walk_backward()
-                    self._speak_response("Moving backward")
-                    
-            elif 'left' in command:
-                if self.spider:
-                    self.spider.turn_left()
-                    self._speak_response("Turning left")
-                    
-            elif 'right' in command:
-                if self.spider:
-                    self.spider.turn_right()
-                    self._speak_response("Turning right")
-                    
-            # Action commands
-            elif 'dance' in command:
-                if self.spider:
-                    self.spider.dance()
-                    self._speak_response("Let me dance for you!")
-                    
-            elif 'wave' in command or 'hello' in command:
-                if self.spider:
-                    self.spider.wave()
-                    self._speak_response("Hello there!")
-                    
-            elif 'sit' in command:
-                if self.spider:
-                    self.spider.sit_down()
-                    self._speak_response("Sitting down")
-                    
-            elif 'stand' in command:
-                if self.spider:
-                    self.spider.stand_up()
-                    self._speak_response("Standing up")
-                    
-            # Camera commands
-            elif any(word in command for word in ['photo', 'picture', 'capture', 'snapshot']):
-                if self.vision:
-                    filename = self.vision.capture_photo()
-                    if filename:
-                        self.stats['photos_captured'] += 1
-                        self._speak_response("Photo captured successfully")
-                        print(f"     📸 Saved: {filename}")
-                    else:
-                        self._speak_response("Photo capture failed")
-                        
-            elif 'what' in command and 'see' in command:
-                if self.vision:
-                    description = self.vision.get_detection_description()
-                    self._speak_response(description)
-                    print(f"     👁️  {description}")
-                    
-            elif 'stop' in command:
-                if self.spider:
-                    self.spider.stop()
-                self._speak_response("Stopped")
-                if self.oled:
-                    self.oled.update_mode("STOPPED")
-                    
-            # AI-processed commands
+            handler = self._command_handlers.get(self._match_intent(command))
+            if handler:
+                handler()
             else:
-                if self.ai and self.ai.client:
-                    try:
-                        ai_response = self.ai.process_command(command)
-                        parsed = json.loads(ai_response)
-                        action = parsed.get('action', 'unknown')
-                        response = parsed.get('response', 'Command processed')
-                        
-                        print(f"     🤖 AI: {response}")
-                        self._speak_response(response)
-                        
-                        # Execute AI-determined action
-                        action_map = {
-                            'walk_forward': lambda: self.spider.walk_forward() if self.spider else None,
-                            'turn_left': lambda: self.spider.turn_left() if self.spider else None,
-                            'turn_right': lambda: self.spider.turn_right() if self.spider else None,
-                            'dance': lambda: self.spider.dance() if self.spider else None,
-                            'wave': lambda: self.spider.wave() if self.spider else None,
-                            'take_photo': lambda: self.vision.capture_photo() if self.vision else None
-                        }
-                        
-                        if action in action_map:
-                            action_map[action]()
-                            
-                    except Exception as e:
-                        print(f"     ❌ AI processing error: {e}")
-                        self._speak_response("I couldn't understand that command")
-                else:
-                    print(f"     ⚠️  Unknown command (AI not available)")
-                    self._speak_response("I don't understand that command")
+                self._handle_ai_command(command)
                     
         except Exception as e:
             print(f"     ❌ Command execution error: {e}")
-            traceback.print_exc()
-            self.stats['errors'] += 1
+            log.exception("Command execution error")
+            self._count(ERRORS)
             if self.oled:
                 self.oled.update_mode("ERROR")
-                time.sleep(2)
+                self._stop_event.wait(2)
                 
         finally:
             if self.oled:
                 self.oled.update_mode("LISTENING")
                 
+    @staticmethod
+    def _match_intent(command: str) -> Optional[str]:
+        """Find the highest-priority intent mentioned in a command"""
+        matched = {m.lastgroup for m in _COMMAND_RE.finditer(command)}
+        if 'see' not in matched:
+            matched.discard('what')
+        
+        for intent in _COMMAND_PRIORITY:
+            if intent in matched:
+                return intent
+        return None
+    
+    def _cmd_forward(self):
+        if self.spider:
+            self.spider.walk_forward()
+            self._speak_response("Moving forward")
+    
+    def _cmd_backward(self):
+        if self.spider:
+            self.spider.walk_backward()
+            self._speak_response("Moving backward")
+    
+    def _cmd_left(self):
+        if self.spider:
+            self.spider.turn_left()
+            self._speak_response("Turning left")
+    
+    def _cmd_right(self):
+        if self.spider:
+            self.spider.turn_right()
+            self._speak_response("Turning right")
+    
+    def _cmd_dance(self):
+        if self.spider:
+            self.spider.dance()
+            self._speak_response("Let me dance for you!")
+    
+    def _cmd_wave(self):
+        if self.spider:
+            self.spider.wave()
+            self._speak_response("Hello there!")
+    
+    def _cmd_sit(self):
+        if self.spider:
+            self.spider.sit_down()
+            self._speak_response("Sitting down")
+    
+    def _cmd_stand(self):
+        if self.spider:
+            self.spider.stand_up()
+            self._speak_response("Standing up")
+    
+    def _cmd_photo(self):
+        if self.vision:
+            filename = self.vision.capture_photo()
+            if filename:
+                self._count(PHOTOS)
+                self._speak_response("Photo captured successfully")
+                print(f"     📸 Saved: {filename}")
+            else:
+                self._speak_response("Photo capture failed")
+    
+    def _cmd_describe(self):
+        if self.vision:
+            description = self.vision.get_detection_description()
+            self._speak_response(description)
+            print(f"     👁️  {description}")
+    
+    def _cmd_stop(self):
+        if self.spider:
+            self.spider.stop()
+        self._speak_response("Stopped")
+        if self.oled:
+            self.oled.update_mode("STOPPED")
+    
+    def _handle_ai_command(self, command: str):
+        """Let the AI engine interpret commands with no keyword match"""
+        if not (self.ai and self.ai.client):
+            print(f"     ⚠️  Unknown command (AI not available)")
+            self._speak_response("I don't understand that command")
+            return
+        
+        try:
+            ai_response = self.ai.process_command(command)
+            parsed = json_loads(ai_response)
+            action = parsed.get('action', 'unknown')
+            response = parsed.get('response', 'Command processed')
+            
+            print(f"     🤖 AI: {response}")
+            self._speak_response(response)
+            
+            # Execute AI-determined action
+            handler = self._get_ai_action(action)
+            if handler:
+                handler()
+                    
+        except Exception as e:
+            print(f"     ❌ AI processing error: {e}")
+            self._speak_response("I couldn't understand that command")
+    
+    def _get_ai_action(self, action: str):
+        """Resolve an AI action to a bound component method (cached per action)"""
+        if action in self._ai_action_map:
+            return self._ai_action_map[action]
+        if action not in AI_ACTIONS:
+            return None
+        
+        component, method = AI_ACTIONS[action]
+        target = getattr(self, component)
+        handler = getattr(target, method, None) if target else None
+        self._ai_action_map[action] = handler
+        return handler
+    
     def _speak_response(self, text: str):
         """Speak response (placeholder for TTS)"""
         print(f"     💬 Response: {text}")
@@ -367,15 +668,19 @@ class HeySpiderRobot:
         }
         signal_name = signal_names.get(signum, f"Signal {signum}")
         
+        # Wake anything blocked on the stop event, whichever interrupt this is
+        self.running = False
+        self._stop_event.set()
+        
         # First interrupt - initiate graceful shutdown
         if not self.shutdown_requested:
             self.shutdown_requested = True
-            print(f"\n{'='*60}")
+            print(f"\n{SHUTDOWN_RULE}")
             print(f"🛑 Received {signal_name} - Initiating graceful shutdown...")
-            print(f"{'='*60}")
+            print(f"{SHUTDOWN_RULE}")
             print("⏱️  Stopping all systems safely...")
             print("⚠️  Press Ctrl+C again to force quit (not recommended)")
-            print(f"{'='*60}\n")
+            print(f"{SHUTDOWN_RULE}\n")
             
             # Start shutdown in background thread
             shutdown_thread = threading.Thread(
@@ -398,9 +703,9 @@ class HeySpiderRobot:
         
         # Second interrupt - force shutdown
         elif not self.shutdown_in_progress:
-            print(f"\n{'='*60}")
+            print(f"\n{SHUTDOWN_RULE}")
             print("⚠️  FORCE SHUTDOWN REQUESTED!")
-            print(f"{'='*60}")
+            print(f"{SHUTDOWN_RULE}")
             self._force_shutdown()
             sys.exit(1)
         
@@ -422,36 +727,30 @@ class HeySpiderRobot:
                 except:
                     pass
             
-            # Stop subsystems in order
-            shutdown_sequence = [
-                ("Voice Activation", self.voice, 'stop_listening', 2),
-                ("AI Thinking", self.ai, 'stop_thinking', 2),
-                ("Visual Monitoring", self.vision, 'stop_monitoring', 3),
-                ("OLED Display", self.oled, 'stop', 1),
-                ("Spider Controller", self.spider, 'cleanup', 2),
+            # Stop methods bound up front (None when the subsystem is missing).
+            # Voice, AI, vision and web are independent and stop together; the OLED
+            # and servos only go down once nothing can still be driving them
+            shutdown_phases = [
+                [
+                    ("Voice Activation", self.voice and self.voice.stop_listening, 2),
+                    ("AI Thinking", self.ai and self.ai.stop_thinking, 2),
+                    ("Visual Monitoring", self.vision and self.vision.stop_monitoring, 3),
+                    # Fallback web server runs serve_forever() on a daemon thread
+                    ("Web Server", getattr(self.web, 'shutdown', None), 2),
+                ],
+                [("OLED Display", self.oled and self.oled.stop, 1)],
+                [("Spider Controller", self.spider and self.spider.cleanup, 2)],
             ]
             
-            for name, system, method, timeout in shutdown_sequence:
-                if system:
-                    try:
-                        print(f"   🔄 Stopping {name}...", end=' ', flush=True)
-                        
-                        # Call stop method with timeout
-                        stop_thread = threading.Thread(
-                            target=lambda: getattr(system, method)()
-                        )
-                        stop_thread.start()
-                        stop_thread.join(timeout=timeout)
-                        
-                        if stop_thread.is_alive():
-                            print("⏱️  Timeout")
-                        else:
-                            print("✅")
-                            
-                    except Exception as e:
-                        print(f"❌ Error: {e}")
-                        
-                    time.sleep(0.2)  # Brief pause between stops
+            for phase in shutdown_phases:
+                self._stop_together([entry for entry in phase if entry[1]])
+            
+            # Close shared HTTP connections
+            if self._http:
+                try:
+                    self._http.close()
+                except Exception:
+                    pass
             
             # Cleanup camera
             if self.vision:
@@ -465,11 +764,40 @@ class HeySpiderRobot:
             # Final statistics
             self._print_shutdown_stats()
             
+            # Flush queued error reports
+            _error_listener.stop()
+            
             self.shutdown_in_progress = False
             
         except Exception as e:
             print(f"\n❌ Error during graceful shutdown: {e}")
-            traceback.print_exc()
+            if log.isEnabledFor(logging.DEBUG):
+                traceback.print_exc()
+    
+    @staticmethod
+    def _stop_together(active: list):
+        """Run (name, stop, timeout) entries concurrently, bounded by the longest timeout"""
+        if not active:
+            return
+        
+        names = ', '.join(name for name, _, _ in active)
+        print(f"   🔄 Stopping {names}...", end=' ' if len(active) == 1 else '\n', flush=True)
+        
+        pool = ThreadPoolExecutor(max_workers=len(active), thread_name_prefix="Stop")
+        futures = [(name, pool.submit(stop)) for name, stop, _ in active]
+        wait([future for _, future in futures],
+             timeout=max(timeout for _, _, timeout in active))
+        pool.shutdown(wait=False)
+        
+        for name, future in futures:
+            if len(active) > 1:
+                print(f"      {name}:", end=' ')
+            if not future.done():
+                print("⏱️  Timeout")
+            elif future.exception():
+                print(f"❌ Error: {future.exception()}")
+            else:
+                print("✅")
     
     def _force_shutdown(self):
         """Force immediate shutdown (emergency only)"""
@@ -495,37 +823,40 @@ class HeySpiderRobot:
         except:
             pass
         
+        try:
+            _error_listener.stop()
+        except:
+            pass
+        
         print("✅ Force shutdown complete")
     
     def _print_shutdown_stats(self):
         """Print session statistics on shutdown"""
-        runtime = time.time() - self.start_time
+        runtime = (time.monotonic_ns() - self._start_ns) / 1e9
         
-        print(f"\n{'='*60}")
-        print("📊 SESSION STATISTICS")
-        print(f"{'='*60}")
-        print(f"⏱️  Runtime: {runtime:.1f} seconds ({runtime/60:.1f} minutes)")
-        print(f"📝 Commands Processed: {self.stats.get('commands_processed', 0)}")
-        print(f"📸 Photos Captured: {self.stats.get('photos_captured', 0)}")
-        print(f"👁️  Detections Made: {self.stats.get('detections_made', 0)}")
-        print(f"❌ Errors: {self.stats.get('errors', 0)}")
+        with self._stats_lock:
+            commands, photos, detections, errors = self._stats_values
+        block = STATS_TEMPLATE.format(
+            rule=SHUTDOWN_RULE, runtime=runtime, minutes=runtime / 60,
+            commands=commands, photos=photos, detections=detections, errors=errors
+        )
         
         # Vision stats
         if self.vision:
             try:
                 vstats = self.vision.get_detection_stats()
-                print(f"🎥 Average FPS: {vstats.get('fps', 0):.1f}")
-                print(f"🎯 Detection Time: {vstats.get('avg_detection_time', 0)*1000:.1f}ms")
+                block += (
+                    f"🎥 Average FPS: {vstats.get('fps', 0):.1f}\n"
+                    f"🎯 Detection Time: {vstats.get('avg_detection_time', 0)*1000:.1f}ms\n"
+                )
             except:
                 pass
         
-        print(f"{'='*60}")
+        _write(block + SHUTDOWN_RULE + '\n')
         
     def start(self):
         """Start all robot systems"""
-        print("\n" + "=" * 63)
-        print("🚀 STARTING HEY SPIDER ROBOT SYSTEMS")
-        print("=" * 63)
+        _write(STARTING_HEADER)
         
         self.running = True
         available_systems = []
@@ -556,43 +887,58 @@ class HeySpiderRobot:
             self.oled.update_mode("ACTIVE")
             
         # Print status
-        print("\n" + "=" * 63)
-        print("🎉 HEY SPIDER ROBOT IS NOW ACTIVE!")
-        print("=" * 63)
-        
-        for system in available_systems:
-            print(f"  {system}")
-            
-        print(f"\n🤖 Spider Controller: {'Ready' if self.spider else 'Unavailable'}")
-        print(f"📹 Camera: {'ACTIVE' if self.vision and self.vision.camera_active else 'INACTIVE'}")
-        print(f"🌐 Web Interface: http://0.0.0.0:{settings.WEB_PORT}")
+        lines = [ACTIVE_HEADER]
+        lines.extend(f"  {system}\n" for system in available_systems)
+        lines.append(
+            f"\n🤖 Spider Controller: {'Ready' if self.spider else 'Unavailable'}\n"
+            f"📹 Camera: {'ACTIVE' if self.vision and self.vision.camera_active else 'INACTIVE'}\n"
+            f"🌐 Web Interface: http://0.0.0.0:{self._web_port}\n"
+        )
         
         if available_systems:
-            print("\n📢 Voice Commands: Say 'Hey Spider' + command")
-            print("⌨️  Keyboard: W/↑=forward, A/←=left, D/→=right, Space=dance, P=photo")
+            lines.append(CONTROLS_HELP)
         
-        print("\n" + "=" * 63)
-        print("Press Ctrl+C to stop")
-        print("=" * 63 + "\n")
+        lines.append(STOP_HINT)
+        _write(''.join(lines))
         
         # Start web interface (blocking)
         if self.web:
             try:
-                self.web.run(host='0.0.0.0', port=settings.WEB_PORT, debug=False)
+                self.web.run(host='0.0.0.0', port=self._web_port, debug=False)
             except KeyboardInterrupt:
                 pass  # Signal handler will manage shutdown
             except Exception as e:
                 print(f"❌ Web interface error: {e}")
-                traceback.print_exc()
+                log.exception("Web interface error")
         else:
             print("❌ No web interface available")
             try:
-                while self.running:
-                    time.sleep(1)
+                self._stop_event.wait()
             except KeyboardInterrupt:
                 pass  # Signal handler will manage shutdown
 
 
+@functools.cache
+def _bootstrap_env():
+    """Check the environment and create runtime directories (once per process)"""
+    # Check virtual environment
+    in_venv = hasattr(sys, 'real_prefix') or (
+        hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
+    )
+    
+    if in_venv:
+        print("✅ Running in virtual environment")
+    else:
+        print("⚠️  Not in virtual environment (recommended)")
+    
+    # Create necessary directories (skipped once the marker exists)
+    settings.ensure_dirs()
+    if not DIRS_MARKER.exists():
+        for directory in RUNTIME_DIRS:
+            os.makedirs(directory, exist_ok=True)
+        DIRS_MARKER.touch()
+
+
 def main():
     """Main entry point with comprehensive error handling"""
     
@@ -602,7 +948,7 @@ def main():
         
         logger = setup_logging(
             log_file=settings.get_log_path(),
-            level=settings.LOG_LEVEL
+            level=LOG_LEVEL
         )
         
         logger.info("=" * 80)
@@ -622,21 +968,7 @@ def main():
             print("❌ Python 3.7+ required")
             sys.exit(1)
         
-        # Check virtual environment
-        in_venv = hasattr(sys, 'real_prefix') or (
-            hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
-        )
-        
-        if in_venv:
-            print("✅ Running in virtual environment")
-        else:
-            print("⚠️  Not in virtual environment (recommended)")
-        
-        # Create necessary directories
-        directories = ['images', 'images/raw', 'images/detections', 
-                      'images/night_vision', 'logs', 'data', 'models']
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        _bootstrap_env()
         
         # Initialize robot
         if logger:
@@ -658,7 +990,18 @@ def main():
         # Start the robot
         if logger:
             logger.info("Starting robot systems...")
-        robot.start()
+        
+        # Serve from a worker thread; the main thread only waits on the stop
+        # event, so signal handlers always run promptly whatever the web
+        # server is doing
+        def run_robot():
+            try:
+                robot.start()
+            finally:
+                robot._stop_event.set()
+        
+        threading.Thread(target=run_robot, daemon=True, name="RobotMain").start()
+        robot._stop_event.wait()
         
     except KeyboardInterrupt:
         if logger:
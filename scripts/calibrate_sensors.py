@@ -4,10 +4,15 @@ Calibrate Sensors
 Calibrates ultrasonic sensor and tests OLED display and I2C devices
 """
 
+import functools
+import queue
 import sys
 import time
+import traceback
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,7 +23,43 @@ except ImportError:
     print("⚠️  RPi.GPIO not available - using simulation")
     GPIO_AVAILABLE = False
 
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
 from config.hardware_config import ULTRASONIC_PINS, I2C_CONFIG, SENSOR_CONFIG
+from src.oled_display import pack_pages, send_changed
+
+
+# Echo round trip in microseconds -> one-way distance in cm
+CM_PER_US = SENSOR_CONFIG['ultrasonic']['speed_of_sound'] / 2 / 1_000_000
+
+# Initial sample buffer size (doubled when full)
+MAX_SAMPLES = 1024
+
+
+def _measure_echo(pi, edges: queue.SimpleQueue):
+    """Fire one trigger pulse and return the echo width in microseconds"""
+    timeout = SENSOR_CONFIG['ultrasonic']['timeout']
+    
+    # Drop edges left over from a timed-out measurement
+    while not edges.empty():
+        edges.get_nowait()
+    
+    # Hardware-timed 10us trigger pulse
+    pi.gpio_trigger(ULTRASONIC_PINS['trigger'], 10, 1)
+    
+    try:
+        level, rise_tick = edges.get(timeout=timeout)
+        while level != 1:
+            level, rise_tick = edges.get(timeout=timeout)
+        level, fall_tick = edges.get(timeout=timeout)
+    except queue.Empty:
+        return None
+    
+    return pigpio.tickDiff(rise_tick, fall_tick)
 
 
 def test_ultrasonic():
@@ -27,71 +68,73 @@ def test_ultrasonic():
     print("📏 Ultrasonic Sensor Test")
     print("=" * 60)
     
-    if not GPIO_AVAILABLE:
-        print("❌ RPi.GPIO not available")
+    if not PIGPIO_AVAILABLE:
+        print("❌ pigpio not available")
+        print("Install with: sudo apt install pigpio python3-pigpio")
         return False
     
+    pi = pigpio.pi()
+    if not pi.connected:
+        print("❌ pigpiod not running")
+        print("Start with: sudo systemctl enable --now pigpiod")
+        return False
+    
+    callback = None
+    
     try:
         # Setup GPIO
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(ULTRASONIC_PINS['trigger'], GPIO.OUT)
-        GPIO.setup(ULTRASONIC_PINS['echo'], GPIO.IN)
+        pi.set_mode(ULTRASONIC_PINS['trigger'], pigpio.OUTPUT)
+        pi.set_mode(ULTRASONIC_PINS['echo'], pigpio.INPUT)
+        pi.write(ULTRASONIC_PINS['trigger'], 0)
+        
+        # Edges are timestamped by the daemon, so no Python-side polling
+        edges = queue.SimpleQueue()
+        callback = pi.callback(
+            ULTRASONIC_PINS['echo'], pigpio.EITHER_EDGE,
+            lambda gpio, level, tick: edges.put((level, tick))
+        )
         
-        print(f"✅ GPIO initialized")
+        print(f"✅ GPIO initialized (pigpio)")
         print(f"   Trigger: GPIO {ULTRASONIC_PINS['trigger']}")
         print(f"   Echo: GPIO {ULTRASONIC_PINS['echo']}")
         
         print("\n📊 Taking measurements...")
         print("   Press Ctrl+C to stop\n")
         
-        measurements = []
+        # Raw echo widths; conversion and range filtering happen once at the end
+        pulse_ticks = np.empty(MAX_SAMPLES, dtype=np.int64)
+        n = 0
         
         try:
             while True:
-                # Trigger pulse
-                GPIO.output(ULTRASONIC_PINS['trigger'], GPIO.HIGH)
-                time.sleep(0.00001)
-                GPIO.output(ULTRASONIC_PINS['trigger'], GPIO.LOW)
-                
-                # Wait for echo
-                pulse_start = time.time()
-                pulse_end = time.time()
-                timeout = time.time() + 0.1
-                
-                while GPIO.input(ULTRASONIC_PINS['echo']) == GPIO.LOW:
-                    pulse_start = time.time()
-                    if pulse_start > timeout:
-                        break
+                ticks = _measure_echo(pi, edges)
                 
-                while GPIO.input(ULTRASONIC_PINS['echo']) == GPIO.HIGH:
-                    pulse_end = time.time()
-                    if pulse_end > timeout:
-                        break
-                
-                # Calculate distance
-                pulse_duration = pulse_end - pulse_start
-                distance = pulse_duration * 17150  # Speed of sound / 2
-                distance = round(distance, 2)
-                
-                if distance < 400:  # Valid range
-                    measurements.append(distance)
-                    print(f"Distance: {distance:6.2f} cm", end='\r', flush=True)
+                if ticks is not None:
+                    if n == len(pulse_ticks):
+                        pulse_ticks = np.concatenate((pulse_ticks, np.empty_like(pulse_ticks)))
+                    pulse_ticks[n] = ticks
+                    n += 1
+                    print(f"Distance: {ticks * CM_PER_US:6.2f} cm", end='\r', flush=True)
                 
                 time.sleep(0.1)
                 
         except KeyboardInterrupt:
             print("\n\n🛑 Stopped by user")
         
+        distances = (pulse_ticks[:n] * CM_PER_US).astype(np.float32)
+        max_distance = SENSOR_CONFIG['ultrasonic']['max_distance']
+        arr = distances[(distances > 0) & (distances < max_distance)]  # Valid range
+        
         # Statistics
-        if measurements:
+        if arr.size:
             print("\n" + "=" * 60)
             print("📊 Statistics")
             print("=" * 60)
-            print(f"Measurements: {len(measurements)}")
-            print(f"Min: {min(measurements):.2f} cm")
-            print(f"Max: {max(measurements):.2f} cm")
-            print(f"Average: {sum(measurements)/len(measurements):.2f} cm")
-            print(f"Std Dev: {(sum((x - sum(measurements)/len(measurements))**2 for x in measurements)/len(measurements))**0.5:.2f}")
+            print(f"Measurements: {arr.size}")
+            print(f"Min: {arr.min():.2f} cm")
+            print(f"Max: {arr.max():.2f} cm")
+            print(f"Average: {arr.mean():.2f} cm")
+            print(f"Std Dev: {arr.std():.2f}")
             print("=" * 60)
             return True
         else:
@@ -103,8 +146,36 @@ def test_ultrasonic():
         return False
     
     finally:
-        if GPIO_AVAILABLE:
-            GPIO.cleanup()
+        if callback is not None:
+            callback.cancel()
+        pi.stop()
+
+
+# Names for devices the robot expects on the I2C bus
+KNOWN_I2C_DEVICES = {
+    0x40: "PCA9685 (Servo Controller)",
+    0x3C: "SSD1306 (OLED Display)",
+}
+
+@functools.cache
+def load_font(path: str, size: int):
+    """Load a TrueType font once, falling back to PIL's default font"""
+    from PIL import ImageFont
+    
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _blit(display, frame: bytes, prev: bytearray = None):
+    """Copy a packed frame into the SSD1306 framebuffer and push it"""
+    display.buf[:] = frame
+    
+    if prev is None:
+        display.show()
+    else:
+        send_changed(display, prev)
 
 
 def test_oled():
@@ -117,7 +188,7 @@ def test_oled():
         import board
         import busio
         import adafruit_ssd1306
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
     except ImportError:
         print("❌ OLED libraries not installed")
         print("Install with: pip install adafruit-circuitpython-ssd1306 pillow")
@@ -129,11 +200,14 @@ def test_oled():
         i2c = busio.I2C(board.SCL, board.SDA)
         
         # Initialize display
-        addr = SENSOR_CONFIG['oled']['address']
+        oled_config = SENSOR_CONFIG['oled']
+        width, height, addr = oled_config['width'], oled_config['height'], oled_config['address']
+        screen = (0, 0, width - 1, height - 1)
+        
         print(f"   Connecting to OLED at 0x{addr:02X}...")
         display = adafruit_ssd1306.SSD1306_I2C(
-            SENSOR_CONFIG['oled']['width'],
-            SENSOR_CONFIG['oled']['height'],
+            width,
+            height,
             i2c,
             addr=addr
         )
@@ -145,33 +219,35 @@ def test_oled():
         display.show()
         
         # Load font
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-        except:
-            font = ImageFont.load_default()
+        font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
+        
+        # One canvas reused for every frame
+        image = Image.new('1', (width, height))
+        draw = ImageDraw.Draw(image)
+        
+        # Static patterns are packed once up front
+        frame_size = len(display.buf)
+        
+        draw.text((10, 10), "Hey Spider", font=font, fill=255)
+        text_frame = pack_pages(image)
+        
+        draw.rectangle(screen, outline=255, fill=0)
+        border_frame = pack_pages(image)
         
         # Test patterns
         print("\n🎨 Testing patterns:")
         
         tests = [
-            ("Fill White", lambda: draw.rectangle((0, 0, 127, 63), fill=255)),
-            ("Fill Black", lambda: draw.rectangle((0, 0, 127, 63), fill=0)),
-            ("Text", lambda: draw.text((10, 10), "Hey Spider", font=font, fill=255)),
-            ("Border", lambda: draw.rectangle((0, 0, 127, 63), outline=255, fill=0)),
+            ("Fill White", b'\xff' * frame_size),
+            ("Fill Black", bytes(frame_size)),
+            ("Text", text_frame),
+            ("Border", border_frame),
         ]
         
-        for test_name, test_func in tests:
+        for test_name, frame in tests:
             print(f"   {test_name:15s}: ", end='', flush=True)
             
-            image = Image.new('1', (128, 64))
-            draw = ImageDraw.Draw(image)
-            
-            test_func()
-            
-            display.image(image)
-            display.show()
+            _blit(display, frame)
             
             time.sleep(1)
             print("✓")
@@ -179,25 +255,29 @@ def test_oled():
         # Animation test
         print(f"   Animation test : ", end='', flush=True)
         
+        # Mirror of what the panel shows, so frames only resend changed segments
+        prev = bytearray(display.buf)
+        
+        # Render every frame up front so the loop only sends bytes
+        frames = []
         for frame in range(32):
-            image = Image.new('1', (128, 64))
-            draw = ImageDraw.Draw(image)
-            
-            draw.line((frame*4, 0, frame*4, 63), fill=255)
+            draw.rectangle(screen, fill=0)
             draw.text((30, 25), f"Frame {frame}", font=font, fill=255)
             
-            display.image(image)
-            display.show()
+            pixels = np.array(image)
+            pixels[:, frame*4] = True
+            frames.append(pack_pages(pixels))
+        
+        for frame in frames:
+            _blit(display, frame, prev)
             time.sleep(0.05)
         
         print("✓")
         
         # Final message
-        image = Image.new('1', (128, 64))
-        draw = ImageDraw.Draw(image)
+        draw.rectangle(screen, fill=0)
         draw.text((20, 20), "OLED Test OK!", font=font, fill=255)
-        display.image(image)
-        display.show()
+        _blit(display, pack_pages(image))
         
         time.sleep(2)
         
@@ -210,7 +290,6 @@ def test_oled():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -222,36 +301,30 @@ def test_i2c_devices():
     print("=" * 60)
     
     try:
-        import smbus
+        from smbus2 import SMBus, i2c_msg
     except ImportError:
-        print("❌ smbus not available")
-        print("Install with: sudo apt install python3-smbus")
+        print("❌ smbus2 not available")
+        print("Install with: pip install smbus2")
         return False
     
     try:
-        bus = smbus.SMBus(I2C_CONFIG['bus'])
-        
         print(f"\n📡 Scanning I2C bus {I2C_CONFIG['bus']}...")
         print("   Address  Device")
         print("   " + "-" * 30)
         
         found_devices = []
         
-        for addr in range(0x03, 0x78):
-            try:
-                bus.read_byte(addr)
-                device_name = "Unknown"
-                
-                if addr == 0x40:
-                    device_name = "PCA9685 (Servo Controller)"
-                elif addr == 0x3C:
-                    device_name = "SSD1306 (OLED Display)"
+        with SMBus(I2C_CONFIG['bus']) as bus:
+            for addr in range(0x03, 0x78):
+                # Zero-length write: just the address byte, NACK means no device
+                try:
+                    bus.i2c_rdwr(i2c_msg.write(addr, []))
+                except OSError:
+                    continue
                 
+                device_name = KNOWN_I2C_DEVICES.get(addr, "Unknown")
                 print(f"   0x{addr:02X}     {device_name}")
                 found_devices.append((addr, device_name))
-                
-            except:
-                pass
         
         if found_devices:
             print("\n✅ Found {} device(s)".format(len(found_devices)))
@@ -12,6 +12,8 @@ Helps configure Hey Spider Robot with guided setup
 
 import os
 import sys
+import traceback
+from datetime import datetime
 from pathlib import Path
 
 
@@ -249,62 +251,58 @@ def run_wizard():
     
     # Write new .env
     try:
-        with open(env_path, 'w') as f:
-            f.write("# Hey Spider Robot Configuration\n")
-            f.write("# Generated by setup wizard\n")
-            f.write(f"# Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Write variables by section
-            f.write("# ============================================\n")
-            f.write("# OpenAI API Configuration\n")
-            f.write("# ============================================\n")
-            if 'OPENAI_API_KEY' in env_vars:
-                f.write(f"OPENAI_API_KEY={env_vars['OPENAI_API_KEY']}\n")
-                f.write(f"AI_MODEL={env_vars.get('AI_MODEL', 'gpt-4')}\n")
-            f.write("\n")
-            
-            f.write("# ============================================\n")
-            f.write("# Camera Settings\n")
-            f.write("# ============================================\n")
-            f.write(f"CAMERA_ENABLED={env_vars.get('CAMERA_ENABLED', 'true')}\n")
-            if 'CAMERA_WIDTH' in env_vars:
-                f.write(f"CAMERA_WIDTH={env_vars['CAMERA_WIDTH']}\n")
-                f.write(f"CAMERA_HEIGHT={env_vars['CAMERA_HEIGHT']}\n")
-                f.write(f"CAMERA_FPS={env_vars.get('CAMERA_FPS', '30')}\n")
-            f.write("\n")
-            
-            f.write("# ============================================\n")
-            f.write("# Vision Detection\n")
-            f.write("# ============================================\n")
-            f.write(f"YOLO_MODEL={env_vars.get('YOLO_MODEL', 'yolov8n.pt')}\n")
-            f.write(f"CONFIDENCE_THRESHOLD={env_vars.get('CONFIDENCE_THRESHOLD', '0.5')}\n")
-            f.write("\n")
-            
-            f.write("# ============================================\n")
-            f.write("# Web Interface\n")
-            f.write("# ============================================\n")
-            f.write(f"WEB_PORT={env_vars.get('WEB_PORT', '5000')}\n")
-            f.write(f"WEB_HOST={env_vars.get('WEB_HOST', '0.0.0.0')}\n")
-            f.write("\n")
-            
-            f.write("# ============================================\n")
-            f.write("# Hardware Settings\n")
-            f.write("# ============================================\n")
-            f.write(f"MOCK_HARDWARE={env_vars.get('MOCK_HARDWARE', 'false')}\n")
-            f.write("\n")
-            
-            if 'WAKE_PHRASE' in env_vars:
-                f.write("# ============================================\n")
-                f.write("# Voice Settings\n")
-                f.write("# ============================================\n")
-                f.write(f"WAKE_PHRASE={env_vars['WAKE_PHRASE']}\n")
-                f.write(f"VOICE_TIMEOUT={env_vars.get('VOICE_TIMEOUT', '5')}\n")
-                f.write("\n")
-            
-            f.write("# ============================================\n")
-            f.write("# Logging\n")
-            f.write("# ============================================\n")
-            f.write(f"LOG_LEVEL={env_vars.get('LOG_LEVEL', 'INFO')}\n")
+        rule = "# " + "=" * 44
+        lines = [
+            "# Hey Spider Robot Configuration",
+            "# Generated by setup wizard",
+            f"# Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+        ]
+        
+        def section(title, entries):
+            """Append a commented section header, its entries and a blank line"""
+            lines.extend((rule, f"# {title}", rule, *entries, ""))
+        
+        # Collect variables by section, then write the file in one go
+        section("OpenAI API Configuration", [
+            f"OPENAI_API_KEY={env_vars['OPENAI_API_KEY']}",
+            f"AI_MODEL={env_vars.get('AI_MODEL', 'gpt-4')}",
+        ] if 'OPENAI_API_KEY' in env_vars else [])
+        
+        section("Camera Settings", [
+            f"CAMERA_ENABLED={env_vars.get('CAMERA_ENABLED', 'true')}",
+        ] + ([
+            f"CAMERA_WIDTH={env_vars['CAMERA_WIDTH']}",
+            f"CAMERA_HEIGHT={env_vars['CAMERA_HEIGHT']}",
+            f"CAMERA_FPS={env_vars.get('CAMERA_FPS', '30')}",
+        ] if 'CAMERA_WIDTH' in env_vars else []))
+        
+        section("Vision Detection", [
+            f"YOLO_MODEL={env_vars.get('YOLO_MODEL', 'yolov8n.pt')}",
+            f"CONFIDENCE_THRESHOLD={env_vars.get('CONFIDENCE_THRESHOLD', '0.5')}",
+        ])
+        
+        section("Web Interface", [
+            f"WEB_PORT={env_vars.get('WEB_PORT', '5000')}",
+            f"WEB_HOST={env_vars.get('WEB_HOST', '0.0.0.0')}",
+        ])
+        
+        section("Hardware Settings", [
+            f"MOCK_HARDWARE={env_vars.get('MOCK_HARDWARE', 'false')}",
+        ])
+        
+        if 'WAKE_PHRASE' in env_vars:
+            section("Voice Settings", [
+                f"WAKE_PHRASE={env_vars['WAKE_PHRASE']}",
+                f"VOICE_TIMEOUT={env_vars.get('VOICE_TIMEOUT', '5')}",
+            ])
+        
+        section("Logging", [
+            f"LOG_LEVEL={env_vars.get('LOG_LEVEL', 'INFO')}",
+        ])
+        
+        # Trailing "" from the last section gives the final newline
+        env_path.write_text("\n".join(lines))
         
         print(f"✅ Configuration saved to {env_path}")
         
@@ -331,8 +329,6 @@ def run_wizard():
 
 
 if __name__ == "__main__":
-    from datetime import datetime
-    
     try:
         success = run_wizard()
         sys.exit(0 if success else 1)
@@ -341,6 +337,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Setup failed: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
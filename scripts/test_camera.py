@@ -6,8 +6,12 @@ Tests camera initialization, capture, and performance
 
 import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
@@ -32,6 +36,27 @@ except ImportError:
 from config.hardware_config import CAMERA_CONFIG
 
 
+def _probe_opencv_camera(idx: int):
+    """Open one V4L2 index; returns (idx, frame shape or None, backend, buffer_ok)"""
+    try:
+        cap = cv2.VideoCapture(idx, cv2.CAP_V4L2)
+        
+        # One-frame driver queue and MJPG stream so the probe reads a fresh frame
+        buffer_ok = cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        
+        shape = backend = None
+        if cap.isOpened():
+            ret, frame = cap.retrieve() if cap.grab() else (False, None)
+            if ret:
+                shape = frame.shape
+                backend = cap.getBackendName()
+        cap.release()
+        return idx, shape, backend, buffer_ok
+    except Exception:
+        return idx, None, None, False
+
+
 def test_camera_detection():
     """Detect available cameras"""
     print("=" * 60)
@@ -65,17 +90,16 @@ def test_camera_detection():
     # Test OpenCV cameras
     if OPENCV_AVAILABLE:
         print("\n🔍 Testing OpenCV cameras...")
-        for idx in range(3):
-            try:
-                cap = cv2.VideoCapture(idx)
-                if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret:
-                        cameras_found.append(f"OpenCV Camera {idx}")
-                        print(f"   ✅ Camera {idx} available ({frame.shape})")
-                    cap.release()
-            except:
-                pass
+        # Each open blocks on driver enumeration, so probe all indices at once
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(_probe_opencv_camera, range(3)))
+        
+        for idx, shape, backend, buffer_ok in results:
+            if shape is not None:
+                cameras_found.append(f"OpenCV Camera {idx}")
+                print(f"   ✅ Camera {idx} available ({shape})")
+                print(f"      {backend} buffer size 1: "
+                      f"{'accepted' if buffer_ok else 'ignored'}")
     
     print("\n" + "=" * 60)
     print(f"📊 Found {len(cameras_found)} camera(s)")
@@ -115,11 +139,11 @@ def test_camera_capture():
         # Test frame capture
         print("\n📷 Capturing frames...")
         for i in range(10):
-            frame = camera.get_frame()
-            if frame is not None:
-                print(f"   Frame {i+1}: {frame.shape} - ✓")
-            else:
-                print(f"   Frame {i+1}: None - ✗")
+            with camera.get_frame_view() as frame:
+                if frame is not None:
+                    print(f"   Frame {i+1}: {frame.shape} - ✓")
+                else:
+                    print(f"   Frame {i+1}: None - ✗")
             time.sleep(0.1)
         
         # Test FPS
@@ -140,7 +164,6 @@ def test_camera_capture():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -161,16 +184,22 @@ def test_camera_performance():
         # FPS test
         print("\n🎯 FPS Test (10 seconds)...")
         frame_count = 0
-        start_time = time.time()
-        test_duration = 10
+        last_id = -1
+        start_ns = time.perf_counter_ns()
+        test_duration_ns = 10_000_000_000
         
-        while time.time() - start_time < test_duration:
-            frame = camera.get_frame()
-            if frame is not None:
+        # Block until the capture thread publishes a frame; count each one once
+        while time.perf_counter_ns() - start_ns < test_duration_ns:
+            if not camera.new_frame_event.wait(timeout=0.1):
+                continue
+            camera.new_frame_event.clear()
+            
+            frame_id, frame = camera.get_frame_with_id()
+            if frame is not None and frame_id != last_id:
                 frame_count += 1
-            time.sleep(0.001)
+                last_id = frame_id
         
-        actual_fps = frame_count / test_duration
+        actual_fps = frame_count * 1e9 / (time.perf_counter_ns() - start_ns)
         print(f"   Captured: {frame_count} frames")
         print(f"   Average FPS: {actual_fps:.2f}")
         print(f"   Target FPS: {camera.fps_target}")
@@ -184,9 +213,9 @@ def test_camera_performance():
         print("\n⏱️  Latency Test...")
         latencies = []
         for _ in range(10):
-            start = time.time()
-            frame = camera.get_frame()
-            latency = (time.time() - start) * 1000  # ms
+            start = time.perf_counter_ns()
+            frame = camera.capture_once()
+            latency = (time.perf_counter_ns() - start) / 1e6  # ms
             if frame is not None:
                 latencies.append(latency)
             time.sleep(0.1)
@@ -223,6 +252,14 @@ def test_camera_settings():
     return True
 
 
+def _render_text_sprite(text: str):
+    """Rasterize an overlay label once; returns (sprite, mask of drawn pixels)"""
+    (width, _), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
+    sprite = np.zeros((30 + baseline + 2, 10 + width + 2, 3), dtype=np.uint8)
+    cv2.putText(sprite, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    return sprite, sprite.any(axis=2, keepdims=True)
+
+
 def interactive_camera_view():
     """Interactive camera viewer"""
     print("\n" + "=" * 60)
@@ -237,7 +274,7 @@ def interactive_camera_view():
         from src.camera_ov5647 import OV5647Camera
         
         print("\n🎥 Starting camera...")
-        camera = OV5647Camera()
+        camera = OV5647Camera(pixel_format='BGR')  # Frames arrive ready for imshow
         camera.start_capture()
         time.sleep(1)
         
@@ -248,23 +285,32 @@ def interactive_camera_view():
         
         show_fps = True
         snapshot_count = 0
+        fps_text = fps_sprite = fps_mask = None  # Overlay re-rendered only when text changes
+        display_frame = None  # Reused as get_frame()'s destination
         
         while True:
-            frame = camera.get_frame()
+            # Only fetch and redraw when the capture thread has published a new frame;
+            # otherwise just service the keyboard
+            frame = None
+            if camera.new_frame_event.wait(timeout=0.01):
+                camera.new_frame_event.clear()
+                # get_frame() fills our own buffer, so the overlay can draw on it directly
+                frame = display_frame = camera.get_frame(out=display_frame)
             
             if frame is not None:
-                display_frame = frame.copy()
-                
-                # Convert RGB to BGR for display
-                display_frame = cv2.cvtColor(display_frame, cv2.COLOR_RGB2BGR)
-                
                 # Add FPS overlay
                 if show_fps:
-                    fps_text = f"FPS: {camera.get_fps():.1f}"
-                    cv2.putText(display_frame, fps_text, (10, 30),
-                              cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                    text = f"FPS: {camera.get_fps():.1f}"
+                    if text != fps_text:
+                        fps_text = text
+                        fps_sprite, fps_mask = _render_text_sprite(text)
+                    
+                    h, w = fps_sprite.shape[:2]
+                    roi = frame[:h, :w]
+                    np.copyto(roi, fps_sprite[:roi.shape[0], :roi.shape[1]],
+                              where=fps_mask[:roi.shape[0], :roi.shape[1]])
                 
-                cv2.imshow('Hey Spider Camera', display_frame)
+                cv2.imshow('Hey Spider Camera', frame)
             
             key = cv2.waitKey(1) & 0xFF
             
@@ -274,8 +320,11 @@ def interactive_camera_view():
             elif key == ord('s'):
                 snapshot_count += 1
                 filename = f"images/snapshot_{snapshot_count:03d}.jpg"
-                if camera.save_frame(filename):
-                    print(f"📸 Saved: {filename}")
+                # Write in the background so the preview keeps running
+                future = camera.save_frame_async(filename)
+                if future is not None:
+                    future.add_done_callback(
+                        lambda f, name=filename: print(f"📸 Saved: {name}") if f.result() else None)
             elif key == ord('f'):
                 show_fps = not show_fps
         
@@ -285,7 +334,6 @@ def interactive_camera_view():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -4,8 +4,15 @@ Test Servo Motors
 Tests individual servos and movement sequences
 """
 
+import functools
+import os
+import sched
+import struct
 import sys
+import threading
 import time
+import traceback
+from itertools import groupby
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,6 +27,77 @@ except ImportError:
     print("Install with: pip install adafruit-circuitpython-servokit")
     SERVO_AVAILABLE = False
 
+# Prefer orjson for writing calibration data when installed
+try:
+    import orjson
+    
+    def _dump_json(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def _dump_json(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+# Leg servo channels in ascending order
+SERVO_CHANNEL_LIST = tuple(sorted(set(SERVO_PINS.values())))
+
+# PCA9685 LED0_ON_L; each channel has 4 registers (ON_L, ON_H, OFF_L, OFF_H) from here
+PCA9685_LED0_ON_L = 0x06
+
+
+@functools.cache
+def get_kit():
+    """Create the ServoKit once so PCA9685 setup runs once per session"""
+    return ServoKit(channels=16)
+
+
+def _pulse_counts(servo, angle: int) -> int:
+    """12-bit OFF count that ServoKit would program for this angle"""
+    duty = servo._min_duty + int(angle / servo.actuation_range * servo._duty_range)
+    return (duty + 1) >> 4
+
+
+@functools.cache
+def _pulse_lut(kit) -> tuple:
+    """OFF counts for every whole angle 0-180 (all channels share ServoKit's defaults)"""
+    servo = kit.servo[0]
+    return tuple(_pulse_counts(servo, angle) for angle in range(181))
+
+
+def set_angle_fast(kit, channel: int, angle: int):
+    """Set one servo from the pulse LUT with a single 4-register write"""
+    with kit._pca.i2c_device as i2c:
+        i2c.write(struct.pack('<BHH', PCA9685_LED0_ON_L + 4 * channel, 0, _pulse_lut(kit)[angle]))
+
+
+def spider_bulk_write(kit, angles: dict):
+    """Set several servo angles with one auto-increment I2C write per run of adjacent channels"""
+    channels = sorted(angles)
+    lut = _pulse_lut(kit)
+    
+    for _, run in groupby(enumerate(channels), lambda item: item[1] - item[0]):
+        run = [channel for _, channel in run]
+        buf = bytearray([PCA9685_LED0_ON_L + 4 * run[0]])
+        for channel in run:
+            buf += struct.pack('<HH', 0, lut[angles[channel]])
+        
+        with kit._pca.i2c_device as i2c:
+            i2c.write(buf)
+
+
+def _sweep(kit, channel: int, step: int = 10, interval: float = 0.1):
+    """Sweep one servo 0-180° with each step at a fixed monotonic-clock offset"""
+    scheduler = sched.scheduler(time.monotonic, time.sleep)
+    for i, angle in enumerate(range(0, 181, step)):
+        scheduler.enter(i * interval, 1, set_angle_fast, (kit, channel, angle))
+    scheduler.run()
+
+
+def bulk_set_all(kit, angle: int):
+    """Set all 16 PCA9685 channels to one angle in a single I2C write"""
+    spider_bulk_write(kit, dict.fromkeys(range(16), angle))
+
 
 def test_servo_controller():
     """Test PCA9685 servo controller"""
@@ -33,11 +111,11 @@ def test_servo_controller():
         print("=" * 60)
         
         print("\n📡 Connecting to PCA9685...")
-        kit = ServoKit(channels=16)
+        kit = get_kit()
         print("✅ PCA9685 connected")
         
         # Test each servo
-        servo_channels = sorted(set(SERVO_PINS.values()))
+        servo_channels = SERVO_CHANNEL_LIST
         
         print(f"\n🔧 Testing {len(servo_channels)} servo channels...")
         print("   Press Ctrl+C to stop\n")
@@ -47,13 +125,13 @@ def test_servo_controller():
                 print(f"   Channel {channel:2d}: ", end='', flush=True)
                 
                 # Sweep servo
-                kit.servo[channel].angle = 90   # Center
+                set_angle_fast(kit, channel, 90)   # Center
                 time.sleep(0.2)
-                kit.servo[channel].angle = 0    # Min
+                set_angle_fast(kit, channel, 0)    # Min
                 time.sleep(0.2)
-                kit.servo[channel].angle = 180  # Max
+                set_angle_fast(kit, channel, 180)  # Max
                 time.sleep(0.2)
-                kit.servo[channel].angle = 90   # Center
+                set_angle_fast(kit, channel, 90)   # Center
                 
                 print("✓")
                 time.sleep(0.3)
@@ -62,8 +140,7 @@ def test_servo_controller():
             
             # Return to center
             print("\n🏠 Centering all servos...")
-            for channel in servo_channels:
-                kit.servo[channel].angle = 90
+            spider_bulk_write(kit, dict.fromkeys(servo_channels, 90))
             
             print("✅ Test complete")
             return True
@@ -71,16 +148,14 @@ def test_servo_controller():
         except KeyboardInterrupt:
             print("\n\n🛑 Stopped by user")
             # Center servos on interrupt
-            for channel in servo_channels:
-                try:
-                    kit.servo[channel].angle = 90
-                except:
-                    pass
+            try:
+                spider_bulk_write(kit, dict.fromkeys(servo_channels, 90))
+            except:
+                pass
             return False
     
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -95,7 +170,7 @@ def test_individual_servo():
         print("🎯 Individual Servo Test")
         print("=" * 60)
         
-        kit = ServoKit(channels=16)
+        kit = get_kit()
         
         # Get channel from user
         print("\nAvailable servos:")
@@ -185,7 +260,6 @@ def test_movement_sequence():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -200,7 +274,7 @@ def test_servo_calibration():
         print("📐 Servo Calibration")
         print("=" * 60)
         
-        kit = ServoKit(channels=16)
+        kit = get_kit()
         
         print("\nThis will help you find the correct servo ranges.")
         print("For each servo, note the angles where:")
@@ -213,17 +287,17 @@ def test_servo_calibration():
         for name, channel in sorted(SERVO_PINS.items())[:12]:  # First 12 servos
             print(f"\n📍 Calibrating: {name} (Channel {channel})")
             
-            # Sweep to find range
+            # Sweep to find range in the background so prompts can be answered meanwhile
             print("   Sweeping from 0° to 180°...")
-            for angle in range(0, 181, 10):
-                kit.servo[channel].angle = angle
-                time.sleep(0.1)
+            sweep = threading.Thread(target=_sweep, args=(kit, channel), daemon=True)
+            sweep.start()
             
             # Get user input
             try:
                 min_angle = int(input("   Enter minimum safe angle: "))
                 max_angle = int(input("   Enter maximum safe angle: "))
                 center_angle = int(input("   Enter center/neutral angle: "))
+                sweep.join()  # Sweep must finish before parking at center
                 
                 calibration_data[name] = {
                     'channel': channel,
@@ -242,15 +316,18 @@ def test_servo_calibration():
             except KeyboardInterrupt:
                 print("\n\n🛑 Calibration stopped")
                 break
+            finally:
+                sweep.join()  # Never overlap two sweeps on the bus
         
         # Save calibration data
         if calibration_data:
-            import json
             filename = "data/servo_calibration.json"
             Path("data").mkdir(exist_ok=True)
             
-            with open(filename, 'w') as f:
-                json.dump(calibration_data, f, indent=2)
+            # Write beside the target and rename so a crash never leaves a truncated file
+            tmp = Path(filename + '.tmp')
+            tmp.write_bytes(_dump_json(calibration_data))
+            os.replace(tmp, filename)
             
             print(f"\n💾 Calibration saved to: {filename}")
             print("\n📋 Calibration Summary:")
@@ -274,7 +351,7 @@ def interactive_servo_control():
         print("🎮 Interactive Servo Control")
         print("=" * 60)
         
-        kit = ServoKit(channels=16)
+        kit = get_kit()
         
         print("\nCommands:")
         print("  <channel> <angle>  - Set servo angle (e.g., '0 90')")
@@ -301,11 +378,7 @@ def interactive_servo_control():
                 
                 elif cmd[0] == 'center':
                     print("Centering all servos...")
-                    for i in range(16):
-                        try:
-                            kit.servo[i].angle = 90
-                        except:
-                            pass
+                    bulk_set_all(kit, 90)
                     print("✅ Done")
                 
                 elif cmd[0] == 'sweep' and len(cmd) > 1:
@@ -313,7 +386,7 @@ def interactive_servo_control():
                     if 0 <= channel < 16:
                         print(f"Sweeping channel {channel}...")
                         for angle in range(0, 181, 10):
-                            kit.servo[channel].angle = angle
+                            set_angle_fast(kit, channel, angle)
                             print(f"  {angle}°", end='\r', flush=True)
                             time.sleep(0.1)
                         kit.servo[channel].angle = 90
@@ -344,11 +417,10 @@ def interactive_servo_control():
         
         # Center all servos before exit
         print("\n🏠 Centering all servos...")
-        for i in range(16):
-            try:
-                kit.servo[i].angle = 90
-            except:
-                pass
+        try:
+            bulk_set_all(kit, 90)
+        except:
+            pass
         
         return True
         
@@ -367,7 +439,7 @@ def test_servo_speed():
         print("⚡ Servo Speed Test")
         print("=" * 60)
         
-        kit = ServoKit(channels=16)
+        kit = get_kit()
         
         channel = int(input("\nEnter servo channel (0-15): "))
         
@@ -388,12 +460,12 @@ def test_servo_speed():
         for speed_name, delay in speeds:
             print(f"\n   {speed_name} ({delay}s delay)...")
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             for angle in range(0, 181, 5):
-                kit.servo[channel].angle = angle
+                set_angle_fast(kit, channel, angle)
                 time.sleep(delay)
             
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             print(f"   Time: {duration:.2f}s")
         
         # Return to center
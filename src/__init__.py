@@ -7,41 +7,35 @@ __version__ = "2.0.0"
 __author__ = "Hey Spider Team"
 __description__ = "AI-Powered Quadruped Robot with Real-Time Vision"
 
-# Import main components for easy access
-try:
-    from src.spider_controller import SpiderController
-except ImportError:
-    SpiderController = None
+import importlib
+
+# Component classes are imported on first access via __getattr__, so
+# `import src.X` only pays for the subsystems a session actually uses
+_LAZY_EXPORTS = {
+    'SpiderController': 'src.spider_controller',
+    'OV5647Camera': 'src.camera_ov5647',
+    'VisualMonitor': 'src.visual_monitor',
+    'AIThinking': 'src.ai_thinking',
+    'VoiceActivation': 'src.voice_activation',
+    'OLEDDisplay': 'src.oled_display',
+    'WebInterface': 'src.web_interface',
+}
+
+
+def __getattr__(name: str):
+    """Import component classes on first access (PEP 562)"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = None
+    
+    globals()[name] = value
+    return value
 
-try:
-    from src.camera_ov5647 import OV5647Camera
-except ImportError:
-    OV5647Camera = None
-
-try:
-    from src.visual_monitor import VisualMonitor
-except ImportError:
-    VisualMonitor = None
-
-try:
-    from src.ai_thinking import AIThinking
-except ImportError:
-    AIThinking = None
-
-try:
-    from src.voice_activation import VoiceActivation
-except ImportError:
-    VoiceActivation = None
-
-try:
-    from src.oled_display import OLEDDisplay
-except ImportError:
-    OLEDDisplay = None
-
-try:
-    from src.web_interface import WebInterface
-except ImportError:
-    WebInterface = None
 
 __all__ = [
     'SpiderController',
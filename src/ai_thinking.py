@@ -3,13 +3,17 @@ AI Thinking Engine - GPT Integration (Fixed for OpenAI v1.0+)
 Processes robot state and makes decisions
 """
 
+import hashlib
 import threading
 import time
 import json
 import re
-from typing import Optional, Dict, List
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 
+import numpy as np
+
 try:
     from openai import OpenAI
     OPENAI_AVAILABLE = True
@@ -20,18 +24,63 @@ except ImportError:
 from config.settings import settings
 from src.oled_display import OLEDDisplay
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+COMMAND_CACHE_SIZE = 512
+
+
+class _ThoughtCache:
+    """LRU of recent thoughts keyed by scene, matched by embedding similarity"""
+    
+    def __init__(self, maxsize: int, threshold: float, ttl: float):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (unit embedding, thought, emotion, monotonic ts)
+    
+    def embedding_for(self, key: str) -> Optional[np.ndarray]:
+        """Embedding already fetched for this exact key, if still cached"""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+    
+    def lookup(self, query: np.ndarray) -> Optional[Tuple[str, str]]:
+        """Return (thought, emotion) of the most similar fresh entry above threshold"""
+        # Expired entries can't be replayed, so they must not win the argmax
+        now = time.monotonic()
+        fresh = [(key, entry) for key, entry in self._entries.items() if now - entry[3] <= self.ttl]
+        if not fresh:
+            return None
+        
+        # Vectors are unit length, so one matrix-vector product gives every cosine
+        similarity = np.stack([entry[0] for _, entry in fresh]) @ query
+        best = int(np.argmax(similarity))
+        if similarity[best] < self.threshold:
+            return None
+        
+        key, (_, thought, emotion, _) = fresh[best]
+        self._entries.move_to_end(key)
+        return thought, emotion
+    
+    def insert(self, key: str, embedding: np.ndarray, thought: str, emotion: str):
+        """Store a freshly generated thought, evicting the least recently used"""
+        self._entries[key] = (embedding, thought, emotion, time.monotonic())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 
 class AIThinking:
     """AI engine for robot reasoning and decision making"""
     
     def __init__(self, spider_controller=None, vision_monitor=None, 
-                 oled_display: Optional[OLEDDisplay] = None):
+                 oled_display: Optional[OLEDDisplay] = None,
+                 http_client=None):
         self.spider = spider_controller
         self.vision = vision_monitor
         self.oled = oled_display
         
-        # OpenAI client
+        # OpenAI client (optionally over a shared, caller-owned httpx client)
         self.client = None
+        self.http_client = http_client
         self.model = settings.AI_MODEL
         
         # State
@@ -44,8 +93,23 @@ class AIThinking:
         self.emotional_state = "curious"
         self.thoughts_history = []
         
+        # Near-duplicate scenes reuse a recent thought instead of a new completion
+        self._thought_cache = None
+        if settings.AI_THOUGHT_CACHE_SIZE > 0:
+            self._thought_cache = _ThoughtCache(settings.AI_THOUGHT_CACHE_SIZE,
+                                                settings.AI_THOUGHT_CACHE_SIMILARITY,
+                                                settings.AI_THOUGHT_CACHE_TTL)
+        
+        # Validated command replies keyed by (model, normalized command); LRU order
+        self._cmd_cache = OrderedDict()
+        self._cmd_cache_lock = threading.Lock()
+        
         # Performance tracking
         self.api_calls = 0
+        self.thought_cache_hits = 0
+        self.embedding_calls = 0  # Kept apart from api_calls, which counts completions
+        self.embedding_errors = 0
+        self.command_cache_hits = 0
         self.api_errors = 0
         self.last_api_call = None
         
@@ -68,10 +132,15 @@ class AIThinking:
             print("🧠 Initializing AI thinking engine...")
             
             # Create OpenAI client (v1.0+ style)
+            client_kwargs = {}
+            if self.http_client is not None:
+                client_kwargs['http_client'] = self.http_client
+            
             self.client = OpenAI(
                 api_key=settings.OPENAI_API_KEY,
                 timeout=10.0,
-                max_retries=2
+                max_retries=2,
+                **client_kwargs
             )
             
             # Test API connection with a minimal request
@@ -157,6 +226,18 @@ class AIThinking:
                 self._set_thought("Processing sensory input...", "neutral")
                 return
             
+            # Reuse a recent thought if this scene is close to one already seen
+            cache_key = embedding = None
+            if self._thought_cache is not None:
+                cache_key = self._scene_key(context)
+                embedding = self._scene_embedding(cache_key)
+                if embedding is not None:
+                    cached = self._thought_cache.lookup(embedding)
+                    if cached:
+                        self.thought_cache_hits += 1
+                        self._set_thought(*cached)
+                        return
+            
             # Build prompt
             prompt = self._build_thought_prompt(context)
             
@@ -185,7 +266,9 @@ class AIThinking:
             content = response.choices[0].message.content
             
             # Parse JSON response
-            self._parse_thought_response(content)
+            parsed = self._parse_thought_response(content)
+            if parsed and embedding is not None:
+                self._thought_cache.insert(cache_key, embedding, *parsed)
         
         except json.JSONDecodeError as e:
             print(f"❌ JSON parsing error: {e}")
@@ -197,6 +280,28 @@ class AIThinking:
             self.api_errors += 1
             self._set_thought("Error in thought process", "puzzled")
     
+    @staticmethod
+    def _scene_key(context: Dict) -> str:
+        """Canonical scene description; distance bucketed to 10cm to ignore jitter"""
+        return (f"{context['mode']}|{int(context['distance'] / 10)}|"
+                f"{context['detections']}|{context['is_moving']}")
+    
+    def _scene_embedding(self, key: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of a scene key, fetched once per distinct key"""
+        embedding = self._thought_cache.embedding_for(key)
+        if embedding is not None:
+            return embedding
+        
+        try:
+            self.embedding_calls += 1
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=key, timeout=5)
+            embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+            return embedding / np.linalg.norm(embedding)
+        except Exception as e:
+            print(f"⚠️  Scene embedding error: {e}")
+            self.embedding_errors += 1
+            return None
+    
     def _build_thought_prompt(self, context: Dict) -> str:
         """Build prompt for thought generation"""
         return f"""You are Hey Spider Robot, an AI-powered quadruped robot with vision and movement capabilities.
@@ -216,8 +321,8 @@ Then select one of these emotions: curious, alert, happy, focused, puzzled, tire
 Respond ONLY with valid JSON in this exact format:
 {{"thought": "your thought here", "emotion": "emotion"}}"""
     
-    def _parse_thought_response(self, content: str):
-        """Parse thought response from API"""
+    def _parse_thought_response(self, content: str) -> Optional[Tuple[str, str]]:
+        """Parse thought response from API; returns (thought, emotion) if it was valid JSON"""
         # Extract JSON from response
         json_match = re.search(r'\{.*\}', content, re.DOTALL)
         
@@ -233,6 +338,7 @@ Respond ONLY with valid JSON in this exact format:
                     emotion = 'curious'
                 
                 self._set_thought(thought, emotion)
+                return thought, emotion
             
             except json.JSONDecodeError:
                 # Fallback if JSON is malformed
@@ -240,6 +346,8 @@ Respond ONLY with valid JSON in this exact format:
         else:
             # No JSON found, use raw content
             self._set_thought(content[:50], 'neutral')
+        
+        return None
     
     def _gather_context(self) -> Dict:
         """Gather robot state context"""
@@ -308,6 +416,15 @@ Respond ONLY with valid JSON in this exact format:
                 'response': 'AI system offline - no API key configured'
             })
         
+        # Command replies are deterministic (temperature 0), so repeats can be served from cache
+        cache_key = hashlib.sha256(f"{self.model}\0{command.strip().lower()}".encode()).hexdigest()
+        with self._cmd_cache_lock:
+            cached = self._cmd_cache.get(cache_key)
+            if cached is not None:
+                self._cmd_cache.move_to_end(cache_key)
+                self.command_cache_hits += 1
+                return cached
+        
         try:
             # Build prompt
             prompt = self._build_command_prompt(command)
@@ -328,7 +445,7 @@ Respond ONLY with valid JSON in this exact format:
                         "content": prompt
                     }
                 ],
-                temperature=0.5,
+                temperature=0,
                 max_tokens=100,
                 timeout=5
             )
@@ -350,6 +467,11 @@ Respond ONLY with valid JSON in this exact format:
                         'response': 'Invalid command format'
                     })
                 
+                with self._cmd_cache_lock:
+                    self._cmd_cache[cache_key] = result
+                    if len(self._cmd_cache) > COMMAND_CACHE_SIZE:
+                        self._cmd_cache.popitem(last=False)
+                
                 return result
             else:
                 return json.dumps({
@@ -424,6 +546,10 @@ JSON response:"""
         return {
             'api_calls': self.api_calls,
             'api_errors': self.api_errors,
+            'thought_cache_hits': self.thought_cache_hits,
+            'embedding_calls': self.embedding_calls,
+            'embedding_errors': self.embedding_errors,
+            'command_cache_hits': self.command_cache_hits,
             'success_rate': round(success_rate * 100, 1),
             'thoughts_stored': len(self.thoughts_history),
             'current_thought': self.current_thought,
@@ -5,8 +5,11 @@ Raspberry Pi camera module handler with libcamera support
 
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 try:
@@ -33,20 +36,35 @@ except ImportError:
 
 from config.hardware_config import CAMERA_CONFIG
 
+# Picamera2 names formats by little-endian word order, so "BGR888"
+# lands in memory as R,G,B and "RGB888" as B,G,R
+PICAMERA2_FORMATS = {'RGB': 'BGR888', 'BGR': 'RGB888'}
+
 
 class OV5647Camera:
     """OV5647 camera handler with automatic fallback"""
     
-    def __init__(self):
+    def __init__(self, pixel_format: str = 'RGB'):
+        if pixel_format not in PICAMERA2_FORMATS:
+            raise ValueError(f"pixel_format must be 'RGB' or 'BGR', got {pixel_format!r}")
+        
+        self.pixel_format = pixel_format  # Channel order of published frames
         self.camera = None
         self.camera_type = None  # 'libcamera', 'legacy', 'opencv', or 'mock'
         self.running = False
         self.frame = None
         self.frame_lock = threading.Lock()
+        self._device_lock = threading.Lock()  # Serializes backend reads
+        self.frame_id = 0  # Sequence number of self.frame
+        self.new_frame_event = threading.Event()  # Set whenever a new frame lands
         self.fps = 0
+        self._fps_samples = deque(maxlen=10)  # (frames, seconds) per ~1s batch
         self.frame_count = 0
         self.last_fps_time = time.time()
         
+        # JPEG encode + disk write run here so snapshots never block capture
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='CameraIO')
+        
         # Configuration
         self.width = CAMERA_CONFIG['width']
         self.height = CAMERA_CONFIG['height']
@@ -86,7 +104,8 @@ class OV5647Camera:
             
             # Configure camera
             config = self.camera.create_preview_configuration(
-                main={"size": (self.width, self.height), "format": "RGB888"}
+                main={"size": (self.width, self.height),
+                      "format": PICAMERA2_FORMATS[self.pixel_format]}
             )
             self.camera.configure(config)
             
@@ -148,7 +167,7 @@ class OV5647Camera:
                         if ret and frame is not None:
                             self.camera = camera
                             self.camera_type = 'opencv'
-                            self.frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                            self.frame = self._from_bgr(frame)
                             print(f"   ✅ OpenCV initialized (index {idx})")
                             return True
                         else:
@@ -188,12 +207,24 @@ class OV5647Camera:
             cv2.putText(frame, f"Time: {ts}", (10, self.height - 20),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
             
-            with self.frame_lock:
-                self.frame = frame
+            self._publish_frame(frame)
         
         except Exception as e:
             print(f"❌ Mock frame generation error: {e}")
     
+    def _from_bgr(self, frame: np.ndarray) -> np.ndarray:
+        """Convert an OpenCV BGR frame to the configured channel order"""
+        if self.pixel_format == 'BGR':
+            return frame
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    
+    def _publish_frame(self, frame: np.ndarray):
+        """Store a new frame and wake anyone waiting on new_frame_event"""
+        with self.frame_lock:
+            self.frame = frame
+            self.frame_id += 1
+        self.new_frame_event.set()
+    
     def start_capture(self):
         """Start camera capture thread"""
         if self.running:
@@ -228,43 +259,27 @@ class OV5647Camera:
     def _capture_loop(self):
         """Camera capture loop"""
         frame_count = 0
-        last_time = time.time()
+        last_time = time.monotonic()
         
         while self.running:
             try:
-                if self.camera_type == 'libcamera':
-                    frame_array = self.camera.capture_array()
-                    if frame_array is not None:
-                        with self.frame_lock:
-                            self.frame = frame_array
-                        frame_count += 1
-                
-                elif self.camera_type == 'legacy':
-                    output = io.BytesIO()
-                    self.camera.capture(output, format='rgb')
-                    output.seek(0)
-                    frame_data = np.frombuffer(output.getvalue(), dtype=np.uint8)
-                    frame = frame_data.reshape((self.height, self.width, 3))
-                    with self.frame_lock:
-                        self.frame = frame
+                if self.camera_type == 'mock':
+                    self._generate_mock_frame()
                     frame_count += 1
                 
-                elif self.camera_type == 'opencv':
-                    ret, frame = self.camera.read()
-                    if ret and frame is not None:
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        with self.frame_lock:
-                            self.frame = frame_rgb
+                else:
+                    frame = self._read_device()
+                    if frame is not None:
+                        self._publish_frame(frame)
                         frame_count += 1
                 
-                elif self.camera_type == 'mock':
-                    self._generate_mock_frame()
-                    frame_count += 1
-                
-                # Update FPS
-                current_time = time.time()
+                # Update FPS from the last ~10s of batches so bursty delivery averages out
+                current_time = time.monotonic()
                 if current_time - last_time >= 1.0:
-                    self.fps = frame_count
+                    self._fps_samples.append((frame_count, current_time - last_time))
+                    frames = sum(n for n, _ in self._fps_samples)
+                    elapsed = sum(dt for _, dt in self._fps_samples)
+                    self.fps = frames / max(elapsed, 1e-6)
                     frame_count = 0
                     last_time = current_time
                 
@@ -275,23 +290,102 @@ class OV5647Camera:
                 print(f"❌ Capture error: {e}")
                 time.sleep(0.1)
     
-    def get_frame(self) -> Optional[np.ndarray]:
-        """Get latest frame"""
+    def _read_device(self, flush: bool = False) -> Optional[np.ndarray]:
+        """Read one frame in pixel_format order from the active camera backend"""
+        with self._device_lock:
+            if self.camera_type == 'libcamera':
+                # capture_array() waits for the next completed request
+                return self.camera.capture_array()
+            
+            if self.camera_type == 'legacy':
+                output = io.BytesIO()
+                self.camera.capture(output, format=self.pixel_format.lower())
+                frame_data = np.frombuffer(output.getvalue(), dtype=np.uint8)
+                return frame_data.reshape((self.height, self.width, 3))
+            
+            if self.camera_type == 'opencv':
+                if flush:
+                    self.camera.grab()  # Drop the frame already queued in the driver
+                ret, frame = self.camera.read()
+                if ret and frame is not None:
+                    return self._from_bgr(frame)
+        
+        return None
+    
+    def capture_once(self) -> Optional[np.ndarray]:
+        """Capture a fresh frame on demand instead of returning the latest buffered one"""
+        try:
+            if self.camera_type == 'mock':
+                self._generate_mock_frame()
+                return self.get_frame()
+            return self._read_device(flush=True)
+        except Exception as e:
+            print(f"❌ Capture error: {e}")
+            return None
+    
+    def get_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Get latest frame, copied into out when it is a matching buffer"""
         with self.frame_lock:
             if self.frame is not None:
+                if out is not None and out.shape == self.frame.shape and out.dtype == self.frame.dtype:
+                    np.copyto(out, self.frame)
+                    return out
                 return self.frame.copy()
         return None
     
+    @contextmanager
+    def get_frame_view(self):
+        """Borrow the latest frame as a read-only view (no copy)"""
+        # Published frames are never written again, so aliasing one is safe
+        with self.frame_lock:
+            frame = self.frame
+        
+        if frame is None:
+            yield None
+            return
+        
+        view = frame.view()
+        view.flags.writeable = False
+        yield view
+    
+    def get_frame_with_id(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Get latest frame together with its sequence number"""
+        with self.frame_lock:
+            if self.frame is not None:
+                return self.frame_id, self.frame.copy()
+            return self.frame_id, None
+    
     def save_frame(self, filename: str) -> bool:
-        """Save current frame to file"""
+        """Save current frame to file; True once the file has been written"""
+        future = self.save_frame_async(filename)
+        return future is not None and future.result()
+    
+    def save_frame_async(self, filename: str) -> Optional[Future]:
+        """Queue current frame to be saved; the Future resolves to True once written"""
         try:
-            frame = self.get_frame()
+            # Published frames are never mutated, so the worker can use this one as-is
+            with self.frame_lock:
+                frame = self.frame
             if frame is not None:
-                # Convert RGB to BGR for OpenCV
-                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                cv2.imwrite(filename, frame_bgr)
-                return True
-            return False
+                return self._io_pool.submit(self._encode_and_write, frame, filename,
+                                            self.pixel_format == 'RGB')
+            return None
+        except Exception as e:
+            print(f"❌ Frame save error: {e}")
+            return None
+    
+    @staticmethod
+    def _encode_and_write(frame: np.ndarray, filename: str, is_rgb: bool = True) -> bool:
+        """Encode a frame as JPEG and write it (runs on the IO pool)"""
+        try:
+            # OpenCV encodes BGR
+            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR) if is_rgb else frame
+            ok, jpeg = cv2.imencode('.jpg', frame_bgr, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if not ok:
+                raise ValueError("JPEG encoding failed")
+            with open(filename, 'wb') as f:
+                f.write(jpeg.tobytes())
+            return True
         except Exception as e:
             print(f"❌ Frame save error: {e}")
             return False
@@ -311,6 +405,7 @@ class OV5647Camera:
     def cleanup(self):
         """Cleanup resources"""
         self.stop_capture()
+        self._io_pool.shutdown(wait=True)  # Let queued snapshots finish writing
         self.camera = None
         self.frame = None
         print("✅ Camera cleanup complete")
\ No newline at end of file
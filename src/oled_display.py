@@ -8,6 +8,8 @@ import time
 from datetime import datetime
 from typing import List, Dict, Optional
 
+import numpy as np
+
 try:
     import board
     import busio
@@ -20,6 +22,39 @@ except ImportError:
 
 from config.hardware_config import I2C_CONFIG, SENSOR_CONFIG
 
+# SSD1306 address-window commands and diff segment size (16 x 64 bytes)
+SSD1306_SET_COL_ADDR = 0x21
+SSD1306_SET_PAGE_ADDR = 0x22
+SEGMENT_BYTES = 64
+
+
+def pack_pages(image) -> bytes:
+    """Pack a 1-bit PIL image (or bool pixel array) into the SSD1306 framebuffer layout"""
+    pixels = np.asarray(image)
+    # SSD1306 pages are 8 rows tall, top row in bit 0
+    pages = pixels.reshape(-1, 8, pixels.shape[1])
+    return np.packbits(pages, axis=1, bitorder='little').tobytes()
+
+
+def send_changed(display, prev: bytearray):
+    """Send only the framebuffer segments that differ from prev"""
+    buf = display.buf
+    
+    for start in range(0, len(buf), SEGMENT_BYTES):
+        end = start + SEGMENT_BYTES
+        if buf[start:end] == prev[start:end]:
+            continue
+        
+        # Narrow the write window to this segment's columns on one page
+        page, col = divmod(start, display.width)
+        for cmd in (SSD1306_SET_COL_ADDR, col, col + SEGMENT_BYTES - 1,
+                    SSD1306_SET_PAGE_ADDR, page, page):
+            display.write_cmd(cmd)
+        
+        with display.i2c_device:
+            display.i2c_device.write(b'\x40' + buf[start:end])
+        prev[start:end] = buf[start:end]
+
 
 class OLEDDisplay:
     """OLED display controller with threaded updates"""
@@ -206,12 +241,26 @@ class OLEDDisplay:
                 time_text = datetime.now().strftime("%H:%M:%S")
                 draw.text((90, 50), time_text, font=self.font_small, fill=255)
             
-            self.display.image(image)
-            self.display.show()
+            self._push_changed(image)
             
         except Exception as e:
             print(f"❌ Render error: {e}")
     
+    def _push_changed(self, image):
+        """Send only the framebuffer segments that differ from what is on screen"""
+        display = self.display
+        
+        # Mock display has no framebuffer
+        if not hasattr(display, 'buf'):
+            display.image(image)
+            display.show()
+            return
+        
+        # display.buf holds the last frame shown until the new one is copied in
+        shown = bytearray(display.buf)
+        display.buf[:] = pack_pages(image)
+        send_changed(display, shown)
+    
     def update_mode(self, mode: str):
         """Update robot mode"""
         with self.update_lock:
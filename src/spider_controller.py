@@ -22,7 +22,7 @@ except ImportError:
     print("Warning: RPi.GPIO not available - using mock GPIO")
     GPIO_AVAILABLE = False
 
-from config.hardware_config import SERVO_PINS, ULTRASONIC_PINS
+from config.hardware_config import SERVO_CHANNELS, LEG_INDEX, JOINT, ULTRASONIC_PINS
 from src.oled_display import OLEDDisplay
 
 
@@ -112,11 +112,12 @@ class SpiderController:
         angle = max(self.servo_min, min(self.servo_max, angle))
         
         # Get servo index
-        servo_key = f"{leg}_{joint}"
-        if servo_key not in SERVO_PINS:
+        leg_idx = LEG_INDEX.get(leg)
+        joint_idx = JOINT.get(joint)
+        if leg_idx is None or joint_idx is None:
             return
             
-        servo_index = SERVO_PINS[servo_key]
+        servo_index = SERVO_CHANNELS[leg_idx][joint_idx]
         
         # Update current position
         if leg in self.current_positions:
@@ -127,7 +128,7 @@ class SpiderController:
             try:
                 self.servos.servo[servo_index].angle = angle
             except Exception as e:
-                print(f"Servo error ({servo_key}): {e}")
+                print(f"Servo error ({leg}_{joint}): {e}")
             
     def _set_leg_position(self, leg: str, shoulder: int, elbow: int, foot: int):
         """Set all joints of a leg"""
@@ -441,22 +442,22 @@ class SpiderController:
             time.sleep(0.00001)
             GPIO.output(ULTRASONIC_PINS['trigger'], GPIO.LOW)
             
-            pulse_start = time.time()
-            pulse_end = time.time()
-            timeout = time.time() + 0.1
+            # Integer monotonic clock: immune to NTP steps, no float per poll
+            pulse_start = pulse_end = time.monotonic_ns()
+            timeout = pulse_start + 100_000_000  # 100 ms
             
             while GPIO.input(ULTRASONIC_PINS['echo']) == GPIO.LOW:
-                pulse_start = time.time()
+                pulse_start = time.monotonic_ns()
                 if pulse_start > timeout:
                     return 0.0
                     
             while GPIO.input(ULTRASONIC_PINS['echo']) == GPIO.HIGH:
-                pulse_end = time.time()
+                pulse_end = time.monotonic_ns()
                 if pulse_end > timeout:
                     return 0.0
                     
-            pulse_duration = pulse_end - pulse_start
-            distance = pulse_duration * 17150
+            # 17150 cm/s (half the speed of sound) = 1.715e-5 cm/ns
+            distance = (pulse_end - pulse_start) * 1.715e-5
             distance = round(distance, 2)
             
             if self.oled:
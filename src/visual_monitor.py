@@ -24,7 +24,7 @@ except ImportError:
     print("Warning: YOLO not available - object detection disabled")
     YOLO_AVAILABLE = False
 
-from config.yolo_detection_config import YOLOConfig, ENHANCED_CLASS_INFO
+from config.yolo_detection_config import YOLOConfig, get_class_colors
 from src.oled_display import OLEDDisplay
 from src.utils import timestamp
 
@@ -268,34 +268,40 @@ class VisualMonitor:
             # Process results
             for result in results:
                 if hasattr(result, 'boxes') and result.boxes is not None:
-                    for i in range(len(result.boxes)):
-                        box = result.boxes.xyxy[i].cpu().numpy()
-                        conf = float(result.boxes.conf[i].cpu().numpy())
-                        cls = int(result.boxes.cls[i].cpu().numpy())
+                    # Pull the whole batch off the device once
+                    boxes = result.boxes.xyxy.cpu().numpy()
+                    confs = result.boxes.conf.cpu().numpy()
+                    class_ids = result.boxes.cls.cpu().numpy().astype(np.intp)
+                    
+                    # Apply the confidence threshold to the whole batch at once
+                    keep = confs >= self.config.CONFIDENCE_THRESHOLD
+                    boxes, confs, class_ids = boxes[keep], confs[keep], class_ids[keep]
+                    colors = get_class_colors(class_ids).tolist()
+                    
+                    for box, conf, cls, color in zip(boxes, confs.tolist(),
+                                                     class_ids.tolist(), colors):
+                        class_name = self.model.names.get(cls, f"class_{cls}")
                         
-                        if conf >= self.config.CONFIDENCE_THRESHOLD:
-                            class_name = self.model.names.get(cls, f"class_{cls}")
-                            
-                            detection = {
-                                'class': class_name,
-                                'confidence': conf,
-                                'bbox': box.tolist(),
-                                'class_id': cls,
-                                'timestamp': time.time()
-                            }
-                            detections.append(detection)
-                            
-                            # Draw on frame
-                            x1, y1, x2, y2 = map(int, box)
-                            color = self._get_class_color(cls)
-                            
-                            cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), color, 2)
-                            
-                            label = f"{class_name}: {conf:.2f}"
-                            cv2.putText(
-                                annotated_frame, label, (x1, y1 - 10),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2
-                            )
+                        detection = {
+                            'class': class_name,
+                            'confidence': conf,
+                            'bbox': box.tolist(),
+                            'class_id': cls,
+                            'timestamp': time.time()
+                        }
+                        detections.append(detection)
+                        
+                        # Draw on frame
+                        x1, y1, x2, y2 = map(int, box)
+                        color = tuple(color)
+                        
+                        cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), color, 2)
+                        
+                        label = f"{class_name}: {conf:.2f}"
+                        cv2.putText(
+                            annotated_frame, label, (x1, y1 - 10),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2
+                        )
             
             self.latest_detections = detections
             self.annotated_frame = annotated_frame
@@ -314,15 +320,6 @@ class VisualMonitor:
             print(f"Error: Detection processing failed: {e}")
             self._generate_mock_detections()
     
-    def _get_class_color(self, class_id: int) -> Tuple[int, int, int]:
-        """Get color for object class"""
-        if class_id in ENHANCED_CLASS_INFO:
-            return ENHANCED_CLASS_INFO[class_id]['color']
-        
-        # Generate consistent color
-        np.random.seed(class_id)
-        return tuple(map(int, np.random.randint(0, 255, 3)))
-    
     def _generate_mock_frame(self):
         """Generate mock camera frame"""
         try:
@@ -19,6 +19,12 @@ except ImportError:
     print("⚠️  Flask/SocketIO not available")
     FLASK_AVAILABLE = False
 
+try:
+    import eventlet
+    EVENTLET_AVAILABLE = True
+except ImportError:
+    EVENTLET_AVAILABLE = False
+
 from config.settings import settings
 from src.oled_display import OLEDDisplay
 
@@ -49,7 +55,7 @@ class WebInterface:
             cors_allowed_origins="*",
             ping_timeout=settings.SOCKETIO_PING_TIMEOUT,
             ping_interval=settings.SOCKETIO_PING_INTERVAL,
-            async_mode='threading'
+            async_mode=self._async_mode()
         )
         
         # Status
@@ -654,6 +660,19 @@ class WebInterface:
         
         print("✅ Web interface stopped")
     
+    @staticmethod
+    def _async_mode() -> str:
+        """SocketIO server mode from settings ('eventlet' needs main.py's monkey-patch)"""
+        if settings.SOCKETIO_ASYNC_MODE == 'eventlet':
+            if not EVENTLET_AVAILABLE:
+                print("⚠️  eventlet not installed - using threading mode")
+                return 'threading'
+            if not eventlet.patcher.is_monkey_patched('thread'):
+                print("⚠️  eventlet requested but not monkey-patched - using threading mode")
+                print("   Set SOCKETIO_ASYNC_MODE=eventlet in the environment that launches main.py")
+                return 'threading'
+        return settings.SOCKETIO_ASYNC_MODE
+    
     def run(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
         """Run web interface (alias for start)"""
         self.start(host, port, debug)
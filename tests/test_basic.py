@@ -195,6 +195,114 @@ def interactive_servo_control():
         return False
 
 
+# ============================================
+# Pure-Python decision logic
+# ============================================
+def test_match_intent_precedence():
+    """Earlier COMMAND_KEYWORDS intents win when several words match"""
+    from main import HeySpiderRobot
+    
+    match = HeySpiderRobot._match_intent
+    assert match("walk back") == 'forward'
+    assert match("turn left then right") == 'left'
+    assert match("stop and dance") == 'dance'
+    assert match("what do you see") == 'what'
+    assert match("what is that") is None  # 'what' needs 'see'
+    assert match("can you see me") == 'see'
+    assert match("take a picture") == 'photo'
+    assert match("sing a song") is None
+
+
+def test_filter_detections_mask():
+    """Vectorized mask agrees with should_include, including IDs past COCO"""
+    import numpy as np
+    from config.yolo_detection_config import filter_detections, should_include
+    
+    class_ids = np.array([0, 0, 11, 12, 14, 39, 80, 200, 300, -1])
+    confidences = np.array([0.55, 0.65, 0.99, 0.99, 0.5, 0.9, 0.9, 0.1, 0.9, 0.55])
+    
+    mask = filter_detections(class_ids, confidences)
+    
+    assert mask.tolist() == [should_include(int(c), float(p))
+                             for c, p in zip(class_ids, confidences)]
+    # -1 gets the default threshold, not person's 0.6
+    assert mask.tolist() == [False, True, False, False, True, True, True, False, True, True]
+
+
+def test_class_colors_match_scalar_lookup():
+    """Batch box colors agree with get_class_color, including out-of-range IDs"""
+    import numpy as np
+    from config.yolo_detection_config import get_class_color, get_class_colors
+    
+    class_ids = np.array([0, 15, 79, 80, 255, 256, 300, -1, -5])
+    
+    assert [tuple(c) for c in get_class_colors(class_ids).tolist()] == \
+        [tuple(get_class_color(int(c))) for c in class_ids]
+
+
+def test_thought_cache_lru_and_ttl(monkeypatch):
+    """Cache evicts least recently used entries and never replays expired ones"""
+    import numpy as np
+    from src import ai_thinking
+    
+    now = [1000.0]
+    monkeypatch.setattr(ai_thinking.time, 'monotonic', lambda: now[0])
+    
+    unit = np.eye(3, dtype=np.float32)
+    cache = ai_thinking._ThoughtCache(maxsize=2, threshold=0.9, ttl=60)
+    cache.insert('a', unit[0], "thought a", 'calm')
+    cache.insert('b', unit[1], "thought b", 'happy')
+    
+    # Looking up 'a' makes 'b' the least recently used, so 'c' evicts it
+    assert cache.lookup(unit[0]) == ("thought a", 'calm')
+    cache.insert('c', unit[2], "thought c", 'alert')
+    assert cache.embedding_for('b') is None
+    assert cache.lookup(unit[1]) is None
+    assert cache.lookup(unit[2]) == ("thought c", 'alert')
+    
+    # A stale best match must not hide a fresh entry above the threshold
+    now[0] += 61
+    cache.insert('c2', (unit[2] + 0.1 * unit[0]) / np.linalg.norm(unit[2] + 0.1 * unit[0]),
+                 "thought c2", 'focused')
+    assert cache.lookup(unit[0]) is None
+    assert cache.lookup(unit[2]) == ("thought c2", 'focused')
+
+
+def test_process_command_does_not_cache_fallbacks(monkeypatch):
+    """Only validated replies are memoized; error and format fallbacks are retried"""
+    import json
+    from types import SimpleNamespace
+    from src.ai_thinking import AIThinking
+    
+    monkeypatch.setattr(AIThinking, '_initialize_openai', lambda self: None)
+    ai = AIThinking()
+    
+    replies = iter([
+        RuntimeError("network down"),
+        '{"action": "stop"}',
+        '{"action": "stop", "response": "Stopping"}',
+    ])
+    calls = []
+    
+    def create(**kwargs):
+        calls.append(kwargs)
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+    
+    ai.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    
+    assert json.loads(ai.process_command("stop"))['action'] == 'unknown'
+    assert json.loads(ai.process_command("stop"))['response'] == 'Invalid command format'
+    assert json.loads(ai.process_command("Stop "))['response'] == 'Stopping'
+    assert json.loads(ai.process_command("stop"))['response'] == 'Stopping'
+    
+    assert len(calls) == 3
+    assert ai.command_cache_hits == 1
+    assert all(call['temperature'] == 0 for call in calls)
+
+
 if __name__ == "__main__":
     import argparse
     